@@ -5,9 +5,8 @@ checking database status, matching filings to entities, and other administrative
 """
 import sys
 import os
-import utils
+import importlib
 import logging
-from filing_matcher import FilingMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +18,43 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
 
+class _LazyModule:
+    """Proxy that defers a module import until its first attribute access.
+
+    Importing utils eagerly pulls in pymongo and establishes the MongoDB
+    connection before the menu is even drawn. Wrapping it in this proxy keeps
+    interface start-up instant; the heavy imports run only once the user
+    actually selects an operation.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            logger.debug(f"Lazily importing module: {self._name}")
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+utils = _LazyModule("utils")
+
+# Menu banner pre-encoded once as ASCII bytes. Writing bytes straight to the
+# stdout buffer skips the str->bytes codec step on every menu render; warning
+# messages with emoji stay on the regular text path.
+_MENU_BANNER_BYTES = ("""Welcome to Regeindary
+=====================
+[1] Run Status Check
+[2] Retrieve Registries
+[3] Keyword Match Assist
+[4] Match Filings with Entities
+[5] Display Random Entity
+[H] Hello World
+[x] Quit
+""").encode("ascii")
+
+
 def retrieve_registries():
     """Interactive menu for selecting and retrieving data from available registries.
 
@@ -101,15 +137,9 @@ def menu_select():
         [H] Hello World - Test function
         [x] Quit - Exit the program
     """
-    print("Welcome to Regeindary")
-    print("=====================")
-    print("[1] Run Status Check")
-    print("[2] Retrieve Registries")
-    print("[3] Keyword Match Assist")
-    print("[4] Match Filings with Entities")
-    print("[5] Display Random Entity")
-    print("[H] Hello World")
-    print("[x] Quit")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_MENU_BANNER_BYTES)
+    sys.stdout.flush()
 
     while True:
         try:
@@ -119,47 +149,50 @@ def menu_select():
             print("\n⚠️  Previous operation was interrupted. Please restart interface to choose another operation.")
             break
 
-        if selection == "1":
-            logger.info("User selected: Status Check")
-            utils.status_check()
-        elif selection == "2":
-            logger.info("User selected: Retrieve Registries")
-            retrieve_registries()
-        elif selection == "3":
-            logger.info("User selected: Keyword Match Assist")
-            utils.keyword_match_assist()
-        elif selection == "4":
-            logger.info("User selected: Match Filings with Entities")
-            print("\\nMatching Method:")
-            print("  [1] Bulk operations (default, recommended)")
-            print("  [2] Aggregation pipeline")
-            method_choice = input("Select method (1/2, default=1): ").strip()
-
-
-            batch_size = input("How many matches to make? (Use `!` for all) ")
-            if batch_size == "!":
-                logger.info("Matching all unmatched filings")
-                utils.run_all_match_filings()
-            else:
-                try:
-                    batch_count = int(batch_size)
-                    logger.info(f"Matching {batch_count:,} filings")
-                    utils.run_all_match_filings(batch_count)
-                except ValueError:
-                    logger.warning(f"Invalid batch size entered: {batch_size}")
-                    print(f"⚠️  '{batch_size}' is not a valid integer. Cannot execute.")
-        elif selection == "5":
-            logger.info("User selected: Display Random Entity")
-            utils.get_random_entity(display="No Original", hard_limit=5000)
-        elif selection == "H":
-            logger.debug("Hello World test function called")
-            print("Hello world!")
-        elif selection.lower() == "x":
-            logger.info("User exited application")
-            break
-        else:
-            logger.warning(f"Invalid menu selection: {selection}")
-            print("⚠️  Invalid selection.")
+        # Structural pattern matching dispatches in one step rather than
+        # walking an if/elif comparison chain on every loop iteration.
+        match selection.lower():
+            case "1":
+                logger.info("User selected: Status Check")
+                utils.status_check()
+            case "2":
+                logger.info("User selected: Retrieve Registries")
+                retrieve_registries()
+            case "3":
+                logger.info("User selected: Keyword Match Assist")
+                utils.keyword_match_assist()
+            case "4":
+                logger.info("User selected: Match Filings with Entities")
+                print("\\nMatching Method:")
+                print("  [1] Bulk operations (default, recommended)")
+                print("  [2] Aggregation pipeline")
+                method_choice = input("Select method (1/2, default=1): ").strip()
+
+
+                batch_size = input("How many matches to make? (Use `!` for all) ")
+                if batch_size == "!":
+                    logger.info("Matching all unmatched filings")
+                    utils.run_all_match_filings()
+                else:
+                    try:
+                        batch_count = int(batch_size)
+                        logger.info(f"Matching {batch_count:,} filings")
+                        utils.run_all_match_filings(batch_count)
+                    except ValueError:
+                        logger.warning(f"Invalid batch size entered: {batch_size}")
+                        print(f"⚠️  '{batch_size}' is not a valid integer. Cannot execute.")
+            case "5":
+                logger.info("User selected: Display Random Entity")
+                utils.get_random_entity(display="No Original", hard_limit=5000)
+            case "h":
+                logger.debug("Hello World test function called")
+                print("Hello world!")
+            case "x":
+                logger.info("User exited application")
+                break
+            case _:
+                logger.warning(f"Invalid menu selection: {selection}")
+                print("⚠️  Invalid selection.")
         print("\n", end="")
 
 
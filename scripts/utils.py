@@ -4,7 +4,11 @@ This module provides MongoDB operations, field mapping, data upload, and entity-
 matching functionality for importing heterogeneous civil society registry data into
 a unified database structure.
 """
-import inspect
+import atexit
+import collections
+import concurrent.futures
+import functools
+import itertools
 import tomllib
 import os
 
@@ -15,11 +19,20 @@ from datetime import datetime
 from pprint import pp
 import random
 import sys
+import time
 import logging
 from typing import Any
 
 from bson import ObjectId
 
+# orjson parses JSON several times faster than the stdlib; fall back silently
+# since it is an optional speedup, not a requirement
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,9 +51,13 @@ if parent_dir not in sys.path:
 
 
 # Prerequisite Functions to Create Globals
+@functools.lru_cache(maxsize=1)
 def get_config():
     """Load MongoDB configuration from config.toml file.
 
+    Cached: the TOML file is parsed once per process and the same dict is
+    returned on subsequent calls.
+
     Returns:
         dict: Configuration dictionary containing MongoDB connection settings.
 
@@ -72,9 +89,14 @@ def get_config():
     return config
 
 
+@functools.lru_cache(maxsize=1)
 def get_mongo_dbs():
     """Initialize MongoDB client and return database and collection mappings.
 
+    Cached so the module-level MongoClient is created exactly once per process:
+    re-imports or repeated calls reuse the same client (and its connection pool)
+    instead of paying a fresh TCP handshake and cold-pool latency.
+
     Returns:
         tuple: A tuple containing:
             - mongodb_regeindary (Database): MongoDB database instance
@@ -82,7 +104,16 @@ def get_mongo_dbs():
     """
     config = get_config()
 
-    py_client = pymongo.MongoClient(config['mongo_path'])
+    py_client = pymongo.MongoClient(
+        config['mongo_path'],
+        maxPoolSize=50,
+        minPoolSize=5,        # Warm a few connections eagerly so the first query isn't slow
+        maxIdleTimeMS=60000,  # Retire connections idle past a minute; minPoolSize keeps the floor warm
+        appname="regeindary"
+    )
+    # Close the shared pool on interpreter shutdown; everything in this
+    # process reaches MongoDB through this one client
+    atexit.register(py_client.close)
     mongodb_regeindary = py_client[config['database_name']]
 
     collections = {
@@ -99,7 +130,52 @@ mongo_regeindary, collections_map = get_mongo_dbs()
 meta = collections_map['registries']
 orgs = collections_map['organizations']
 filings = collections_map['filings']
-cache = dict()
+# LRU cache of organization lookups for match_filing: OrderedDict so a full
+# cache evicts only its least-recently-used entry instead of being discarded
+# wholesale (which produced a cache-miss storm every 10k filings)
+cache = collections.OrderedDict()
+_CACHE_MAX_ENTRIES = 10000
+
+# Sentinel for "field absent" so transform loops can use a single dict.get()
+# instead of a membership test followed by a lookup
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_collection(collection):
+    """Resolve and memoize the Collection handle for a logical collection name.
+
+    Database.__getitem__ builds a fresh Collection object on every access;
+    memoizing the handle lets callers (and their chunk loops) share one, and
+    gives a stable base for with_options() variants.
+
+    Args:
+        collection (str): Logical collection name ('organizations', 'filings',
+            'registries').
+
+    Returns:
+        pymongo.collection.Collection: Memoized collection handle.
+    """
+    return mongo_regeindary[collections_map[collection]]
+
+
+def _diagnostic_collection(collection_name):
+    """Return a collection handle that prefers replica-set secondaries for reads.
+
+    Diagnostic queries (status counts, random-entity sampling) tolerate
+    slightly stale data, so routing them to a secondary keeps the primary
+    free for the write-heavy import/match workloads. On a standalone server
+    this is a no-op.
+
+    Args:
+        collection_name (str): Actual MongoDB collection name (e.g. the orgs global).
+
+    Returns:
+        pymongo.collection.Collection: Handle with secondaryPreferred read preference.
+    """
+    return mongo_regeindary[collection_name].with_options(
+        read_preference=pymongo.ReadPreference.SECONDARY_PREFERRED
+    )
 
 # Index Configuration
 # Defines all indexes for the database with their uniqueness constraints.
@@ -109,13 +185,18 @@ INDEX_CONFIG = {
         (['registryID', 'entityIndex'], True, None),   # Primary unique constraint
         (['registryID', 'entityId'], False, None),     # Lookup by public ID (not unique due to subsidiaries)
         (['registryID'], False, None),                 # Basic registry filtering
+        # Covered variants for filing matching: with _id in the index, the
+        # {"_id": 1} projection is answered from the index alone (no doc fetch)
+        (['registryID', 'entityIndex', '_id'], False, None),
+        (['registryID', 'entityId', '_id'], False, None),
     ],
     'filings': [
         (['registryID', 'filingIndex'], True, None),   # Primary unique constraint
         (['registryID', 'entityId'], False, None),     # Find filings for entity
         (['entityId_mongo'], False, None),             # Traverse to matched organization
         (['registryID'], False, None),                 # Basic registry filtering
-        (['registryID', 'entityId_mongo'], False, None)
+        (['registryID', 'entityId_mongo'], False, None),
+        (['entityId_mongo', 'recordDate'], False, None),  # Most-recent-filing lookups (equality + sort)
         # (['registryID', '_id'], False, {"entityId_mongo": None}),  # May aide filing-org matching
         # (['entityId_mongo'], False, {"entityId_mongo": None})        # May aide filing-org matching
 
@@ -126,13 +207,50 @@ INDEX_CONFIG = {
 }
 
 
-def check_for_cache(folder: str = "", label: str = "", suffix: str = "csv") -> bool:
+def _noninteractive() -> bool:
+    """Return True when prompts should be skipped (REGEINDARY_NONINTERACTIVE=1).
+
+    Checked at call time rather than import time so a scripted caller can
+    toggle the environment variable between operations.
+    """
+    return os.environ.get("REGEINDARY_NONINTERACTIVE") == "1"
+
+
+def _noninteractive_answer(default, env_var, valid):
+    """Resolve the answer for a prompt being skipped in a non-interactive run.
+
+    The caller-supplied default wins; otherwise the answer comes from the
+    named environment variable, so scripted runs (REGEINDARY_NONINTERACTIVE=1)
+    work through entry points like run_everything() that don't thread a
+    default down to the prompting function.
+
+    Args:
+        default (str or None): Default passed by the caller, if any.
+        env_var (str): Environment variable to consult when no default given.
+        valid (tuple): Accepted answers for this prompt.
+
+    Returns:
+        str or None: The resolved answer, or None if prompting should proceed.
+    """
+    if default in valid:
+        return default
+    env_answer = os.environ.get(env_var, "").lower().strip()
+    return env_answer if env_answer in valid else None
+
+
+def check_for_cache(folder: str = "", label: str = "", suffix: str = "csv",
+                    default: str | None = None) -> bool:
     """Check if a cached data file exists and prompt user whether to use it.
 
     Args:
         folder (str): Directory path where cache file is located. Defaults to "".
         label (str): Label to distinguish cache files. Defaults to "".
         suffix (str): File extension for cache file. Defaults to "csv".
+        default (str, optional): Answer to use instead of prompting when
+            REGEINDARY_NONINTERACTIVE=1 is set: 'y' to download a new copy,
+            'n' to use the cache. When omitted, the REGEINDARY_CACHE_DEFAULT
+            environment variable is consulted instead. Ignored in
+            interactive runs.
 
     Returns:
         bool: True if cached file should be used, False if new download is needed.
@@ -147,6 +265,12 @@ def check_for_cache(folder: str = "", label: str = "", suffix: str = "csv") -> b
     logger.info(f"Checking cache path: {cache_path}")
     if os.path.exists(cache_path):
         logger.info("Cached file found")
+        if _noninteractive():
+            answer = _noninteractive_answer(default, "REGEINDARY_CACHE_DEFAULT", ("y", "n"))
+            if answer is not None:
+                cached = answer == "n"
+                logger.info(f"Non-interactive run: cache decision defaulted to '{answer}'")
+                return cached
         cached = None
         while cached is None:
             option = input(" Download new copy? (y/n) ")
@@ -163,12 +287,17 @@ def check_for_cache(folder: str = "", label: str = "", suffix: str = "csv") -> b
     return cached
 
 
-def delete_old_records(registry_id, collection='organizations'):
+def delete_old_records(registry_id, collection='organizations', default=None):
     """Check for existing records and prompt user to delete them or use incremental update.
 
     Args:
         registry_id (ObjectId): MongoDB ObjectId of the registry.
         collection (str): Collection name ('organizations' or 'filings'). Defaults to 'organizations'.
+        default (str, optional): Answer to use instead of prompting when
+            REGEINDARY_NONINTERACTIVE=1 is set: 'y', 'i', 'n', or 's' with the
+            same meanings as the interactive menu. When omitted, the
+            REGEINDARY_EXISTING_RECORDS_DEFAULT environment variable is
+            consulted instead. Ignored in interactive runs.
 
     Returns:
         str or int: 'y' if records deleted, 'n' if skipped, 's' to skip upload,
@@ -176,9 +305,25 @@ def delete_old_records(registry_id, collection='organizations'):
     """
     global mongo_regeindary, collections_map
 
-    record_count = mongo_regeindary[collections_map[collection]].count_documents({"registryID": registry_id})
+    # Ensure the registryID index exists so the filtered count below is an
+    # index scan rather than a collection scan on first-run databases
+    ensure_indexes(collections=[collection], verbose=False)
+    record_count = _get_collection(collection).count_documents(
+        {"registryID": registry_id},
+        hint="registryID_1"
+    )
     logger.info(f"Found {record_count:,} existing records for this registry in '{collection}' collection")
     if record_count > 0:
+        if _noninteractive():
+            answer = _noninteractive_answer(
+                default, "REGEINDARY_EXISTING_RECORDS_DEFAULT", ("y", "i", "n", "s"))
+            if answer is not None:
+                logger.info(f"Non-interactive run: existing-records decision defaulted to '{answer}'")
+                if answer == "y":
+                    logger.warning(f"Deleting {record_count:,} existing records from '{collection}' collection")
+                    _get_collection(collection).delete_many({"registryID": registry_id})
+                    logger.info("Old records deleted successfully")
+                return answer
         delete_option = None
         option = None
         while delete_option is None:
@@ -196,7 +341,7 @@ def delete_old_records(registry_id, collection='organizations'):
                 print(" Invalid option. Select 'y', 'i', 'n', or 's'.")
         if delete_option:
             logger.warning(f"Deleting {record_count:,} existing records from '{collection}' collection")
-            mongo_regeindary[collections_map[collection]].delete_many({"registryID": registry_id})
+            _get_collection(collection).delete_many({"registryID": registry_id})
             logger.info("Old records deleted successfully")
             option = "y"
         return option
@@ -204,18 +349,156 @@ def delete_old_records(registry_id, collection='organizations'):
 
 from datetime import datetime
 
+def _transform_record(indexed_record, mapping_items, static, collection, include_original=True):
+    """Transform a single (index, record) pair into a MongoDB upload document.
+
+    Applies the origin -> target field mapping, fills in the fallback unique
+    index fields for registries that don't map them, and embeds the record as
+    "Original Data". Kept at module level (rather than as a closure) so it can
+    be dispatched to worker processes by send_all_to_mongodb.
+
+    Args:
+        indexed_record (tuple): (1-based index, record dict) pair.
+        mapping_items (list): Materialized (origin, target) mapping pairs.
+        static (dict): Static fields to add to every record.
+        collection (str): Target collection name.
+        include_original (bool or str): If True, embed the full source record
+            under "Original Data". If False or "residual", embed only the
+            residual fields the mapping did not capture. If "omit", skip
+            "Original Data" entirely (maximum BSON-size relief, at the cost of
+            the raw-data fallback). Defaults to True.
+
+    Returns:
+        dict: Document ready for insertion.
+    """
+    i, record = indexed_record
+
+    # Single C-level dict merge instead of copy() followed by per-field updates
+    upload_dict = {
+        **static,
+        **{target: record[origin] for origin, target in mapping_items if origin in record}
+    }
+
+    # Ensure unique index fields exist (fallback for registries that don't map them)
+    # TODO: add to glossary for filingIndex and entity Index
+    if collection == 'organizations':
+        if 'entityIndex' not in upload_dict and 'entityId' in upload_dict:
+            upload_dict['entityIndex'] = upload_dict['entityId']
+        elif 'entityIndex' not in upload_dict and 'entityId' not in upload_dict:
+            upload_dict['entityIndex'] = i
+            upload_dict['entityId'] = i
+    elif collection == 'filings':
+        if 'filingIndex' not in upload_dict and 'filingId' in upload_dict:
+            upload_dict['filingIndex'] = upload_dict['filingId']
+        elif 'filingIndex' not in upload_dict and 'filingId' not in upload_dict:
+            upload_dict['filingIndex'] = i
+            upload_dict['filingId'] = i
+
+    # Create null values to aid indexing and avoid partial_index "$not" / "$exists: false" issue
+    if collection == 'filings':
+        upload_dict['entityId_mongo'] = None
+
+    if include_original == "omit":
+        pass
+    elif include_original:
+        upload_dict["Original Data"] = record
+    else:
+        # Keep only what the mapping didn't capture - for registries with high
+        # mapping coverage this roughly halves the BSON document size
+        mapped_origins = {origin for origin, _ in mapping_items}
+        upload_dict["Original Data"] = {k: v for k, v in record.items() if k not in mapped_origins}
+    return upload_dict
+
+
+def _transform_records_columnar(records, mapping_items, static, collection, include_original):
+    """Transform a uniform-key record list in one columnar pandas pass.
+
+    Equivalent to mapping _transform_record over the records, but the field
+    rename happens as a single DataFrame column relabel instead of one dict
+    merge per record. Only valid when every record has the same key set
+    (which holds for all current registries - their rows come out of
+    DataFrame.to_dict("records")); send_all_to_mongodb checks that before
+    choosing this path.
+
+    Args:
+        records (list): Record dictionaries, all sharing the same keys.
+        mapping_items (list): Materialized (origin, target) mapping pairs.
+        static (dict): Static fields to add to every record.
+        collection (str): Target collection name.
+        include_original (bool): Same semantics as _transform_record.
+
+    Yields:
+        dict: Documents ready for insertion, in input order.
+    """
+    import pandas as pd
+
+    # dtype=object is load-bearing: pandas' default inference would coerce
+    # null-bearing int columns to float64 and every None to NaN, which pymongo
+    # stores as a BSON double - corrupting string-contract fields and
+    # float-ifying ids. Object dtype carries the Python values through
+    # untouched, so the output matches _transform_record exactly.
+    frame = pd.DataFrame(records, dtype=object)
+    rename = {origin: target for origin, target in mapping_items if origin in frame.columns}
+    mapped = frame[list(rename)].rename(columns=rename)
+
+    # Mapped fields win over static ones on collision, matching the
+    # {**static, **mapped} merge order in _transform_record
+    for key, value in static.items():
+        if key not in mapped.columns:
+            mapped[key] = value
+
+    # Ensure unique index fields exist (fallback for registries that don't map them)
+    positions = range(1, len(frame) + 1)
+    if collection == 'organizations':
+        if 'entityIndex' not in mapped.columns:
+            if 'entityId' in mapped.columns:
+                mapped['entityIndex'] = mapped['entityId']
+            else:
+                mapped['entityIndex'] = positions
+                mapped['entityId'] = positions
+    elif collection == 'filings':
+        if 'filingIndex' not in mapped.columns:
+            if 'filingId' in mapped.columns:
+                mapped['filingIndex'] = mapped['filingId']
+            else:
+                mapped['filingIndex'] = positions
+                mapped['filingId'] = positions
+
+    if collection == 'filings':
+        mapped['entityId_mongo'] = None
+
+    if include_original == "omit":
+        pass
+    elif include_original:
+        mapped['Original Data'] = records
+    else:
+        mapped_origins = {origin for origin, _ in mapping_items}
+        mapped['Original Data'] = [
+            {k: v for k, v in record.items() if k not in mapped_origins} for record in records
+        ]
+
+    # to_dict boxes numpy scalars back to native Python types for pymongo
+    slice_size = 10000
+    for start in range(0, len(mapped), slice_size):
+        yield from mapped.iloc[start:start + slice_size].to_dict("records")
+
+
 def send_all_to_mongodb(
         records: list[dict],
         mapping: dict[str, str],
         static: dict[str, Any],
         collection: str = 'organizations',
-        chunk_size: int = 5000
+        chunk_size: int = 5000,
+        write_concern: pymongo.WriteConcern | None = None,
+        include_original: bool = True,
+        coll: pymongo.collection.Collection | None = None,
+        insert_workers: int = 1
 ) -> dict[int, ObjectId]:
     """Upload multiple records to MongoDB using batch insertion with progress tracking.
 
     Optimized to use insert_many() for batch insertion instead of looping insert_one().
-    Pre-processes all records to apply mapping transformations, then inserts all documents
-    in across multiple batch operations (depending on size) for better performance.
+    Applies mapping transformations and inserts documents in interleaved batches of
+    chunk_size, so only one batch of transformed documents is held in memory at a time.
 
     Args:
         records (list): List of record dictionaries to upload.
@@ -223,6 +506,25 @@ def send_all_to_mongodb(
         static (dict): Static fields to add to every record (e.g., registryID, registryName).
         collection (str): Target collection name. Defaults to 'organizations'.
         chunk_size (int): Number of documents per batch insert. Defaults to 5000.
+        write_concern (pymongo.WriteConcern, optional): Relaxed write concern for
+            throughput-sensitive bulk loads, e.g. WriteConcern(w=1, j=False) when
+            re-importing a registry that can simply be re-run on failure. Defaults
+            to None, which keeps the configured (durable) write concern.
+        include_original (bool or str): If True, embed the full source record
+            under "Original Data"; if False or "residual", embed only the
+            fields the mapping didn't capture, roughly halving document size
+            for well-mapped registries; if "omit", skip "Original Data"
+            entirely for maximum BSON-size (and insert-throughput) relief.
+            Defaults to True - raw-data preservation is part of the data
+            contract, so slimmer documents are strictly opt-in.
+        coll (Collection, optional): Explicit collection handle; resolved from
+            the module globals when omitted. Passing it avoids relying on
+            mutable module state (e.g. from worker threads or processes).
+        insert_workers (int): Number of insert batches allowed in flight
+            concurrently. The default of 1 double-buffers (transform batch
+            N+1 while batch N is on the wire); higher values overlap several
+            network round-trips and pair well with a relaxed write_concern
+            such as WriteConcern(w=0) for re-runnable bulk loads. Defaults to 1.
 
     Returns:
         dict: Dictionary mapping record index (1-based) to MongoDB ObjectIds.
@@ -236,69 +538,73 @@ def send_all_to_mongodb(
     ensure_indexes(collections=[collection], verbose=False)
     logger.info("Indexes ensured")
 
-    # Phase 1: Transform records
-    upload_documents = []
-    logger.info(f"Transforming {len(records):,} records for MongoDB insertion")
-    for i, record in enumerate(records, start=1):
-        if (i % 50000 == 0) or (i == len(records)):
-            percentage = "%.2f" % (100 * i/len(records))
-            logger.info(f"\r  Transformed {i:,}/{len(records):,} ({percentage}%) records for {collection}")
-
-        # Apply mapping transformation (same logic as send_to_mongodb)
-        upload_dict = static.copy()
-        for m in mapping.keys():
-            if m in record.keys():
-                upload_dict.update({mapping[m]: record[m]})
-
-        # Ensure unique index fields exist (fallback for registries that don't map them)
-        # TODO: add to glossary for filingIndex and entity Index
-        if collection == 'organizations':
-            if 'entityIndex' not in upload_dict and 'entityId' in upload_dict:
-                upload_dict['entityIndex'] = upload_dict['entityId']
-            elif 'entityIndex' not in upload_dict and 'entityId' not in upload_dict:
-                upload_dict['entityIndex'] = i
-                upload_dict['entityId'] = i
-        elif collection == 'filings':
-            if 'filingIndex' not in upload_dict and 'filingId' in upload_dict:
-                upload_dict['filingIndex'] = upload_dict['filingId']
-            elif 'filingIndex' not in upload_dict and 'filingId' not in upload_dict:
-                upload_dict['filingIndex'] = i
-                upload_dict['filingId'] = i
-
-        # Create null values to aid indexing and avoid partial_index "$not" / "$exists: false" issue
-        if collection == 'filings':
-            upload_dict['entityId_mongo'] = None
-
-        upload_dict.update({"Original Data": record})
-        upload_documents.append(upload_dict)
-
-    # Phase 2: Chunked insertion with progress
-    total_docs = len(upload_documents)
+    # Transform and insert in interleaved batches: only one chunk of
+    # transformed documents is ever resident in memory, which keeps peak
+    # RSS bounded for the largest registries (US has 500k+ records).
+    total_docs = len(records)
     total_chunks = (total_docs + chunk_size - 1) // chunk_size
 
     total_inserted = 0
     total_duplicates = 0
 
-    logger.info(f"Inserting {total_docs:,} documents in {total_chunks:,} batches of up to {chunk_size:,} documents each")
+    logger.info(f"Transforming and inserting {total_docs:,} documents in {total_chunks:,} batches of up to {chunk_size:,} documents each")
     start_time = datetime.now()
 
-    for chunk_num in range(total_chunks):
-        chunk_start = chunk_num * chunk_size
-        chunk_end = min(chunk_start + chunk_size, total_docs)
-        chunk = upload_documents[chunk_start:chunk_end]
+    # The per-record transform is pure CPU-bound dict work. For very large
+    # registries it is worth fanning it out across worker processes; below the
+    # threshold the pickling overhead outweighs the parallelism, so the
+    # transform stays in-process.
+    mapping_items = list(mapping.items())
+    transform = functools.partial(
+        _transform_record,
+        mapping_items=mapping_items,
+        static=static,
+        collection=collection,
+        include_original=include_original
+    )
+
+    parallel_threshold = 200000
+    executor = None
+    columnar = False
+    if total_docs >= parallel_threshold:
+        # Columnar path is only valid for uniform-key rows (true for every
+        # current registry - their records come from DataFrame.to_dict). The
+        # check covers every record: dict-keys equality is a cheap C-level
+        # comparison, and a single stray row past a sampled prefix would
+        # otherwise silently gain null-filled mapped fields in the frame
+        first_keys = records[0].keys()
+        columnar = all(record.keys() == first_keys for record in records)
+    if columnar:
+        logger.info("Transforming records in a single columnar pandas pass")
+        transformed_docs = _transform_records_columnar(
+            records, mapping_items, static, collection, include_original
+        )
+    elif (total_docs >= parallel_threshold) and ((os.cpu_count() or 1) > 1):
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        logger.info(f"Transforming records in parallel across {os.cpu_count()} worker processes")
+        transformed_docs = executor.map(transform, enumerate(records, start=1), chunksize=1000)
+    else:
+        transformed_docs = map(transform, enumerate(records, start=1))
+
+    target_collection = coll if coll is not None else _get_collection(collection)
+    if write_concern is not None:
+        logger.info(f"Using caller-supplied write concern for bulk insert: {write_concern.document}")
+        target_collection = target_collection.with_options(write_concern=write_concern)
+
+    # Progress logging is gated on wallclock rather than emitted per batch -
+    # string formatting for hundreds of batches is measurable overhead and
+    # noise; roughly one status line per second is plenty
+    last_log = 0.0
+
+    def collect_insert_result(future, chunk_len, docs_processed):
+        """Harvest one pending insert_many future and update counters/progress."""
+        nonlocal total_inserted, total_duplicates, last_log
 
         try:
-            result = mongo_regeindary[collections_map[collection]].insert_many(
-                chunk,
-                ordered=False
-            )
-            # all_inserted_ids.extend(result.inserted_ids)
+            result = future.result()
 
             # Count successes
             total_inserted += len(result.inserted_ids)
-
-            # Logger message
-            logger.info(f"  Inserted {len(result.inserted_ids):,} documents into {collection}")
         except BulkWriteError as bwe:
             # Extract successful inserts and duplicate errors
             write_errors = bwe.details.get('writeErrors', [])
@@ -306,20 +612,21 @@ def send_all_to_mongodb(
             other_errors = [e for e in write_errors if e.get('code') != 11000]
 
             # Count successes: chunk size minus errors
-            chunk_inserted = len(chunk) - len(write_errors)
+            chunk_inserted = chunk_len - len(write_errors)
             total_inserted += chunk_inserted
             total_duplicates += len(duplicate_errors)
 
-            # Logger message
-            logger.info(f"  Inserted {chunk_inserted:,} documents into {collection} - {len(duplicate_errors):,} duplicates")
-
             # Re-raise if there are non-duplicate errors
             if other_errors:
-                logger.error(f"Non-duplicate errors encountered during batch insert: len({other_errors})")
+                logger.error("Non-duplicate errors encountered during batch insert: %d", len(other_errors))
                 raise
 
-        # Progress update
-        docs_processed = chunk_end
+        # Progress update (time-budgeted; the final batch always logs)
+        now = time.monotonic()
+        if (now - last_log < 1.0) and (docs_processed < total_docs):
+            return
+        last_log = now
+
         percentage = 100 * docs_processed / total_docs
         elapsed = (datetime.now() - start_time).total_seconds()
 
@@ -335,7 +642,34 @@ def send_all_to_mongodb(
             status += f" - skipped {total_duplicates:,} duplicates"
         # TODO: determine while total_inserted = total_duplicates for England (& other?) registries
 
-        logger.info(f"{status} - ETA {eta}")
+        logger.info("%s - ETA %s", status, eta)
+
+    # Overlap the writes with the transform: pymongo releases the GIL during
+    # network I/O, so while the driver is sending batch N over the wire the
+    # loop is already transforming batch N+1. At most insert_workers batches
+    # are in flight at a time, bounding memory to insert_workers + 1 chunks.
+    insert_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(insert_workers, 1))
+    pending = collections.deque()
+
+    # islice pulls each batch off the transform iterator in one C-level call
+    # instead of appending document-by-document with a length check per doc
+    transformed_docs = iter(transformed_docs)
+    docs_processed = 0
+    while chunk := list(itertools.islice(transformed_docs, chunk_size)):
+        docs_processed += len(chunk)
+
+        while len(pending) >= max(insert_workers, 1):
+            collect_insert_result(*pending.popleft())
+
+        future = insert_executor.submit(target_collection.insert_many, chunk, ordered=False)
+        pending.append((future, len(chunk), docs_processed))
+
+    while pending:
+        collect_insert_result(*pending.popleft())
+
+    insert_executor.shutdown()
+    if executor is not None:
+        executor.shutdown()
 
     logger.info(f"✔ Successfully inserted {total_inserted:,} documents")
 
@@ -345,20 +679,8 @@ def send_all_to_mongodb(
         'total' : total_docs
     }
 
-    # # Batch insert all documents at once
-    # logger.info(f"Inserting {len(upload_documents):,} documents to '{collection}' collection")
-    # result = mongo_regeindary[collections_map[collection]].insert_many(
-    #     upload_documents,
-    #     ordered=False  # Continue on error, more resilient for large batches
-    # )
-    # logger.info(f"✔ Successfully inserted {len(result.inserted_ids):,} documents")
-
-    # Return results in compatible format
-    results = {i+1: result.inserted_ids[i] for i in range(len(result.inserted_ids))}
-    return results
-
 
-def send_to_mongodb(record, mapping, static, collection):
+def send_to_mongodb(record, mapping, static, collection, include_original=True):
     """Upload a single record to MongoDB with field mapping applied.
 
     Args:
@@ -366,23 +688,34 @@ def send_to_mongodb(record, mapping, static, collection):
         mapping (dict): Field mapping dictionary (origin field -> target field).
         static (dict): Static fields to add to the record.
         collection (str): Target collection name.
+        include_original (bool or str): If True, embed the full source record
+            under "Original Data"; if False or "residual", embed only the
+            unmapped fields; if "omit", skip "Original Data" entirely.
+            Defaults to True.
 
     Returns:
         InsertOneResult: MongoDB insert result object.
     """
     global mongo_regeindary, collections_map
     upload_dict = static.copy()
-    for m in mapping.keys():
-        if m in record.keys():
-            upload_dict.update({mapping[m]: record[m]})
+    for origin, target in mapping.items():
+        value = record.get(origin, _MISSING)
+        if value is not _MISSING:
+            upload_dict[target] = value
 
-    upload_dict.update({"Original Data": record})
-    result = mongo_regeindary[collections_map[collection]].insert_one(upload_dict)
+    if include_original == "omit":
+        pass
+    elif include_original:
+        upload_dict.update({"Original Data": record})
+    else:
+        upload_dict.update({"Original Data": {k: v for k, v in record.items() if k not in mapping}})
+    result = _get_collection(collection).insert_one(upload_dict)
 
     return result
 
 
-def preview_new_records(records, mapping, static, collection='organizations', unique_field='entityId'):
+def preview_new_records(records, mapping, static, collection='organizations', unique_field='entityId',
+                        append_only=False):
     """Analyze incoming records to identify new vs existing records before insertion.
 
     Compares incoming records with existing MongoDB records to determine which are new.
@@ -395,6 +728,12 @@ def preview_new_records(records, mapping, static, collection='organizations', un
         static (dict): Static fields (must include registryID).
         collection (str): Target collection name. Defaults to 'organizations'.
         unique_field (str): Field name to use for uniqueness detection. Defaults to 'entityId'.
+        append_only (bool): If True, trust the registry's lastIngestionWatermark
+            (set by send_new_to_mongodb after a successful incremental insert)
+            and classify the already-ingested prefix of the source as duplicates
+            without querying MongoDB for it. Only the delta beyond the watermark
+            is compared. The watermark is spot-checked at its boundaries first
+            and ignored (with a warning) if the check fails. Defaults to False.
 
     Returns:
         tuple: (new_records, duplicate_records, new_indices, duplicate_indices)
@@ -409,61 +748,123 @@ def preview_new_records(records, mapping, static, collection='organizations', un
     if not registry_id:
         raise ValueError("static dict must contain 'registryID' for duplicate detection")
 
-    logger.info(f"Analyzing {len(records):,} records for duplicates in '{collection}' collection")
+    total = len(records)
+    logger.info(f"Analyzing {total:,} records for duplicates in '{collection}' collection")
     print(f"\nAnalyzing new data...")
-    print(f"  ✔ Found {len(records):,} records in source data")
+    print(f"  ✔ Found {total:,} records in source data")
 
     # Ensure indexes for fast duplicate detection
     logger.debug("Ensuring indexes for duplicate detection")
     ensure_indexes(collections=[collection], verbose=False)
 
+    target_collection = _get_collection(collection)
+
     # Get all existing unique field values for this registry (with index hint for speed)
-    existing_count = mongo_regeindary[collections_map[collection]].count_documents(
+    existing_count = target_collection.count_documents(
         {"registryID": registry_id},
         hint="registryID_1"
     )
     print(f"  ✔ Found {existing_count:,} existing records in MongoDB for this registry")
 
-    # Build set of existing IDs for fast lookup (using index for speed)
-    print(f"  Fetching existing {unique_field} values...", end="")
-    existing_ids = set()
-    cursor = mongo_regeindary[collections_map[collection]].find(
-        {"registryID": registry_id},
-        {unique_field: 1, "_id": 0}
-    ).hint("registryID_1")
+    # Brand-new registry: nothing can be a duplicate, so skip the lookup and
+    # categorization passes entirely
+    if existing_count == 0:
+        print("  ✔ No existing records - all incoming records are new")
+        logger.info(f"Preview complete: {total:,} new, 0 duplicates (empty registry)")
+        return list(records), [], list(range(total)), []
 
-    for doc in cursor:
-        if unique_field in doc:
-            existing_ids.add(str(doc[unique_field]))
-    print(f" ✔ ({len(existing_ids):,} unique IDs)")
-
-    # Categorize incoming records
-    print(f"  Categorizing records...", end="")
-    new_records = []
-    duplicate_records = []
-    new_indices = []
-    duplicate_indices = []
-
-    # Find the origin field that maps to the unique field
-    origin_field = None
-    for origin, target in mapping.items():
-        if target == unique_field:
-            origin_field = origin
-            break
+    # Find the origin field that maps to the unique field via an inverse mapping
+    inverse_mapping = {target: origin for origin, target in mapping.items()}
+    origin_field = inverse_mapping.get(unique_field)
 
     if not origin_field:
         # unique_field might be in static fields or not mapped
         logger.warning(f"Could not find mapping for unique_field '{unique_field}' - trying direct field access")
         origin_field = unique_field
 
-    for i, record in enumerate(records):
-        record_id = str(record.get(origin_field, ""))
-        if record_id and record_id in existing_ids:
-            duplicate_records.append(record)
-            duplicate_indices.append(i)
-        else:
-            new_records.append(record)
-            new_indices.append(i)
+    # Append-only delta mode: for sources that only ever grow at the tail,
+    # the watermark recorded after the last successful incremental insert
+    # tells us how much of the file has already been ingested. The prefix is
+    # classified as duplicates outright; only the delta hits MongoDB.
+    skip_prefix = 0
+    if append_only:
+        watermark = (mongo_regeindary[meta].find_one(
+            {"_id": registry_id}, {"lastIngestionWatermark": 1}
+        ) or {}).get("lastIngestionWatermark") or {}
+        prefix_count = min(watermark.get("sourceRecordCount", 0), total)
+        if prefix_count > 0:
+            # Spot-check the prefix boundaries before trusting the watermark -
+            # a reordered or rebuilt source file fails this and falls back to
+            # the full comparison
+            boundary_checks = (records[0], records[prefix_count - 1])
+            verified = all(
+                (boundary_id := check.get(origin_field)) is None
+                or target_collection.count_documents(
+                    {"registryID": registry_id,
+                     unique_field: {"$in": [boundary_id, str(boundary_id)]}},
+                    limit=1
+                ) == 1
+                for check in boundary_checks
+            )
+            if verified:
+                skip_prefix = prefix_count
+                print(f"  ✔ Append-only watermark verified - skipping comparison for first {prefix_count:,} records")
+                logger.info(f"Append-only watermark verified: {prefix_count:,} records treated as already ingested")
+            else:
+                logger.warning("Append-only watermark failed boundary spot-check - falling back to full comparison")
+                print("  ⚠️  Watermark stale (source reordered?) - comparing all records")
+
+    # Push duplicate detection server-side: instead of shipping every stored
+    # unique-field value to the client, ask MongoDB which of the *incoming*
+    # IDs already exist via chunked $in queries against the compound index.
+    # Bytes over the wire scale with the number of duplicates, not the size
+    # of the existing collection. Both the natural and str() forms of each ID
+    # are queried so the lookup survives int-vs-string import differences.
+    print(f"  Checking incoming {unique_field} values against MongoDB...", end="")
+    incoming_ids = list({
+        record.get(origin_field)
+        for record in records[skip_prefix:]
+        if record.get(origin_field) is not None
+    })
+
+    # Matched values are kept as 64-bit hash() digests of their canonical
+    # str() form rather than the strings themselves - membership is all the
+    # categorization pass needs, an int set costs a fraction of the memory of
+    # an equivalent str set, and str() canonicalization covers the
+    # int-vs-string import differences the old dual-form set handled
+    found_ids = set()
+    lookup_chunk_size = 1000
+    distinct_threshold = 250000
+    if (existing_count <= distinct_threshold) and (len(incoming_ids) > lookup_chunk_size):
+        # Small-enough registry, many incoming IDs: one distinct() round-trip
+        # ships every stored value in a single reply (well under the 16MB
+        # distinct cap at this count), beating dozens of chunked $in queries
+        found_ids = {hash(str(value)) for value in
+                     target_collection.distinct(unique_field, {"registryID": registry_id})}
+    else:
+        for chunk_start in range(0, len(incoming_ids), lookup_chunk_size):
+            id_chunk = incoming_ids[chunk_start:chunk_start + lookup_chunk_size]
+            query_values = list({v for v in id_chunk} | {str(v) for v in id_chunk})
+            matches = target_collection.find(
+                {"registryID": registry_id, unique_field: {"$in": query_values}},
+                {unique_field: 1, "_id": 0}
+            )
+            found_ids.update(hash(str(doc[unique_field])) for doc in matches)
+    print(f" ✔ ({len(found_ids):,} matched values)")
+
+    # Categorize incoming records via C-level comprehensions instead of four
+    # list.append calls per record
+    print(f"  Categorizing records...", end="")
+    is_duplicate = [
+        (record_id := record.get(origin_field)) is not None
+        and hash(str(record_id)) in found_ids
+        for record in records[skip_prefix:]
+    ]
+    duplicate_indices = list(range(skip_prefix)) + \
+        [skip_prefix + i for i, dup in enumerate(is_duplicate) if dup]
+    new_indices = [skip_prefix + i for i, dup in enumerate(is_duplicate) if not dup]
+    duplicate_records = [records[i] for i in duplicate_indices]
+    new_records = [records[i] for i in new_indices]
 
     print(" ✔")
 
@@ -480,7 +881,8 @@ def preview_new_records(records, mapping, static, collection='organizations', un
     return new_records, duplicate_records, new_indices, duplicate_indices
 
 
-def send_new_to_mongodb(records, mapping, static, collection='organizations', unique_field='entityId'):
+def send_new_to_mongodb(records, mapping, static, collection='organizations', unique_field='entityId',
+                        append_only=False):
     """Upload only new records to MongoDB, skipping duplicates.
 
     First previews records to identify new vs existing, then prompts user for action.
@@ -492,6 +894,11 @@ def send_new_to_mongodb(records, mapping, static, collection='organizations', un
         static (dict): Static fields to add to every record (must include registryID).
         collection (str): Target collection name. Defaults to 'organizations'.
         unique_field (str): Field name to use for uniqueness detection. Defaults to 'entityId'.
+        append_only (bool): If True, use the registry's lastIngestionWatermark to
+            skip the duplicate comparison for the already-ingested prefix of the
+            source (see preview_new_records), and advance the watermark after a
+            successful insert. Only safe for sources that grow strictly at the
+            tail. Defaults to False.
 
     Returns:
         dict: Dictionary mapping record index (1-based) to MongoDB ObjectIds for inserted records.
@@ -500,7 +907,7 @@ def send_new_to_mongodb(records, mapping, static, collection='organizations', un
 
     # Preview records
     new_records, duplicate_records, new_indices, duplicate_indices = preview_new_records(
-        records, mapping, static, collection, unique_field
+        records, mapping, static, collection, unique_field, append_only=append_only
     )
 
     if len(new_records) == 0:
@@ -520,20 +927,29 @@ def send_new_to_mongodb(records, mapping, static, collection='organizations', un
         if choice == "1":
             # Insert new records only
             logger.info(f"User selected: Insert {len(new_records):,} new records")
-            return send_all_to_mongodb(new_records, mapping, static, collection)
+            results = send_all_to_mongodb(new_records, mapping, static, collection)
+            # Advance the high-watermark so the next append-only preview only
+            # compares records beyond this run's source file
+            mongo_regeindary[meta].update_one(
+                {"_id": static['registryID']},
+                {"$set": {"lastIngestionWatermark": {
+                    "sourceRecordCount": len(records),
+                    "updatedAt": datetime.now()
+                }}}
+            )
+            return results
 
         elif choice == "2":
             # Show sample in MongoDB format (after mapping applied)
             sample_size = min(5, len(new_records))
             print(f"\nShowing {sample_size} sample new records (as they'll appear in MongoDB):")
             print("-" * 70)
+            # Render samples through the same transform the insert path uses,
+            # so the preview matches the stored documents exactly (including
+            # fallback index fields)
+            mapping_items = list(mapping.items())
             for i in range(sample_size):
-                # Apply mapping transformation to show how it will look in MongoDB
-                upload_dict = static.copy()
-                for m in mapping.keys():
-                    if m in new_records[i].keys():
-                        upload_dict.update({mapping[m]: new_records[i][m]})
-                upload_dict.update({"Original Data": new_records[i]})
+                upload_dict = _transform_record((i + 1, new_records[i]), mapping_items, static, collection)
 
                 print(f"\nRecord {i+1}:")
                 pp(upload_dict)
@@ -553,7 +969,8 @@ def send_new_to_mongodb(records, mapping, static, collection='organizations', un
             print("Invalid option. Please select 1, 2, or 3.")
 
 
-def upsert_all_to_mongodb(records, mapping, static, collection='organizations', unique_field='entityId'):
+def upsert_all_to_mongodb(records, mapping, static, collection='organizations', unique_field='entityId',
+                          include_original=True, coll=None):
     """Update existing records and insert new ones (upsert operation).
 
     For each record, updates it if it exists (based on registryID + unique_field),
@@ -565,6 +982,10 @@ def upsert_all_to_mongodb(records, mapping, static, collection='organizations',
         static (dict): Static fields to add to every record (must include registryID).
         collection (str): Target collection name. Defaults to 'organizations'.
         unique_field (str): Field name to use for matching. Defaults to 'entityId'.
+        include_original (bool): If True, embed the full source record under
+            "Original Data"; if False, embed only the unmapped fields. Defaults to True.
+        coll (Collection, optional): Explicit collection handle; resolved from
+            the module globals when omitted.
 
     Returns:
         dict: Dictionary with counts of modified, inserted, and total operations.
@@ -575,49 +996,83 @@ def upsert_all_to_mongodb(records, mapping, static, collection='organizations',
     if not registry_id:
         raise ValueError("static dict must contain 'registryID' for upsert operation")
 
-    # Find the origin field that maps to the unique field
-    origin_field = None
-    for origin, target in mapping.items():
-        if target == unique_field:
-            origin_field = origin
-            break
+    # Resolve the collection handle once rather than re-doing the double dict
+    # lookup at every batch flush
+    target_collection = coll if coll is not None else _get_collection(collection)
+
+    # Without the configured indexes every upsert match runs a collection
+    # scan - catastrophic on large collections
+    logger.debug("Ensuring indexes for upsert matching")
+    ensure_indexes(collections=[collection], verbose=False)
+
+    # Make the index assumption explicit: each bulk upsert filter is
+    # {registryID, unique_field}, which is only cheap if that pair is indexed
+    indexed_field_pairs = {tuple(fields) for fields, _, _ in INDEX_CONFIG.get(collection, [])}
+    if ('registryID', unique_field) in indexed_field_pairs:
+        logger.info(f"Using compound index (registryID, {unique_field}) for upsert matching")
+    else:
+        logger.warning(
+            f"No compound index on (registryID, {unique_field}) in INDEX_CONFIG - "
+            f"upsert matching will fall back to the registryID index and may be slow"
+        )
+
+    # Find the origin field that maps to the unique field via an inverse mapping
+    inverse_mapping = {target: origin for origin, target in mapping.items()}
+    origin_field = inverse_mapping.get(unique_field)
 
     if not origin_field:
         logger.warning(f"Could not find mapping for unique_field '{unique_field}' - trying direct field access")
         origin_field = unique_field
 
-    logger.info(f"Upserting {len(records):,} records to '{collection}' collection")
-    print(f"\nUpserting {len(records):,} records...")
+    total = len(records)
+    logger.info(f"Upserting {total:,} records to '{collection}' collection")
+    print(f"\nUpserting {total:,} records...")
 
     modified_count = 0
     inserted_count = 0
 
+    # Batch upserts into bulk_write calls instead of one update_one round-trip
+    # per record - the server amortizes the write overhead across each batch.
+    batch_size = 1000
+    operations = []
+    mapping_items = list(mapping.items())
+
+    # Progress is gated on wallclock rather than record count: tty writes and
+    # f-string formatting are surprisingly expensive inside the hot loop
+    last_progress = time.monotonic()
+
     for i, record in enumerate(records, start=1):
-        if (i % 100 == 0) or (i == len(records)):
-            percentage = "%.2f" % (100 * i/len(records))
-            print(f"\r  Processed {i:,}/{len(records):,} ({percentage}%) records", end="")
-
-        # Apply mapping transformation
-        upload_dict = static.copy()
-        for m in mapping.keys():
-            if m in record.keys():
-                upload_dict.update({mapping[m]: record[m]})
-        upload_dict.update({"Original Data": record})
+        # Apply mapping transformation as a single C-level dict merge
+        upload_dict = {
+            **static,
+            **{target: record[origin] for origin, target in mapping_items if origin in record},
+            "Original Data": record if include_original
+            else {k: v for k, v in record.items() if k not in mapping}
+        }
 
         # Get unique identifier value
         unique_value = str(record.get(origin_field, ""))
 
-        # Upsert operation
-        result = mongo_regeindary[collections_map[collection]].update_one(
+        operations.append(pymongo.UpdateOne(
             {"registryID": registry_id, unique_field: unique_value},
             {"$set": upload_dict},
             upsert=True
-        )
+        ))
+
+        if (len(operations) >= batch_size) or (i == total):
+            result = target_collection.bulk_write(
+                operations,
+                ordered=False
+            )
+            modified_count += result.matched_count
+            inserted_count += len(result.upserted_ids)
+            operations = []
 
-        if result.matched_count > 0:
-            modified_count += 1
-        elif result.upserted_id:
-            inserted_count += 1
+            now = time.monotonic()
+            if (now - last_progress > 0.5) or (i == total):
+                sys.stdout.write(f"\r  Processed {i:,}/{total:,} ({100*i/total:.2f}%) records")
+                sys.stdout.flush()
+                last_progress = now
 
     print()  # New line after progress
     logger.info(f"✔ Upsert complete: {inserted_count:,} inserted, {modified_count:,} updated")
@@ -626,7 +1081,7 @@ def upsert_all_to_mongodb(records, mapping, static, collection='organizations',
     return {
         "inserted": inserted_count,
         "modified": modified_count,
-        "total": len(records)
+        "total": total
     }
 
 
@@ -650,9 +1105,14 @@ def meta_check(
     Raises:
         Exception: If multiple registries with the same name exist (database integrity error).
     """
-    preexisting_registries = mongo_regeindary[meta].count_documents({"name": registry_name})
-
-    if preexisting_registries == 0:
+    # One find (capped at 2 documents for the integrity check) answers both
+    # "does it exist?" and "what is its _id?", replacing the old
+    # count_documents + find_one double round-trip; only _id is pulled over
+    # the wire since the legal notices can run to several kilobytes
+    preexisting = list(mongo_regeindary[meta].find(
+        {"name": registry_name}, projection={"_id": 1}).limit(2))
+
+    if len(preexisting) == 0:
         logger.info(f"Registry '{registry_name}' not found in metadata collection - creating new entry")
         result = mongo_regeindary[meta].insert_one({
             "name": registry_name,
@@ -660,30 +1120,31 @@ def meta_check(
         })
         logger.info(f"Created new registry metadata with ID: {result.inserted_id}")
         return result.inserted_id, None
-    elif preexisting_registries == 1:
+    elif len(preexisting) == 1:
         logger.info(f"Registry '{registry_name}' found in metadata collection")
-        result = mongo_regeindary[meta].find_one({"name": registry_name})
+        result = preexisting[0]
         decision = delete_old_records(result['_id'], collection)
         return result['_id'], decision
-    elif preexisting_registries >= 2:
-        logger.error(f"Database integrity error: Found {preexisting_registries} registries with name '{registry_name}'")
-        raise Exception(f"Database integrity error: Found {preexisting_registries} registries with name '{registry_name}'. Expected 0 or 1.")
     else:
-        logger.error(f"Unexpected database state: Registry count for '{registry_name}' is {preexisting_registries}")
-        raise Exception(f"Unexpected database state: Registry count for '{registry_name}' is {preexisting_registries}. This should not be possible.")
+        logger.error(f"Database integrity error: Found multiple registries with name '{registry_name}'")
+        raise Exception(f"Database integrity error: Found multiple registries with name '{registry_name}'. Expected 0 or 1.")
 
 
+@functools.lru_cache(maxsize=32)
 def retrieve_mapping(folder: str = "", level: str | None =None) -> dict[str,str]:
     """Load field mapping from mapping.json file.
 
+    Cached per (folder, level) so repeated imports in the same session don't
+    re-parse the JSON; treat the returned dictionary as read-only.
+
     Args:
         folder (str): Directory containing mapping.json. Defaults to current directory.
 
     Returns:
         dict: Dictionary mapping origin field names to target field names.
     """
-    with open(f"{folder}mapping.json", "r") as m:
-        mp = json.load(m)
+    with open(f"{folder}mapping.json", "rb") as m:
+        mp = _json_loads(m.read())
     if not level:
         mapping = {feature['origin']: feature['target'] for feature in mp}
     if level:
@@ -691,9 +1152,13 @@ def retrieve_mapping(folder: str = "", level: str | None =None) -> dict[str,str]
     return mapping
 
 
+@functools.lru_cache(maxsize=32)
 def load_registry_metadata(folder: str = "") -> dict[str,Any]:
     """Load registry metadata from metadata.json file.
 
+    Cached per folder so multi-registry batch runs don't re-parse the same
+    metadata; treat the returned dictionary as read-only.
+
     Args:
         folder (str): Directory containing metadata.json. Defaults to current directory.
 
@@ -702,8 +1167,8 @@ def load_registry_metadata(folder: str = "") -> dict[str,Any]:
     """
     metadata_path = f"{folder}metadata.json"
     logger.info(f"Loading registry metadata from: {metadata_path}")
-    with open(metadata_path, "r") as m:
-        metadata = json.load(m)
+    with open(metadata_path, "rb") as m:
+        metadata = _json_loads(m.read())
     return metadata
 
 
@@ -734,9 +1199,13 @@ def create_registry(
     source_url = metadata['source_url']
     legal_notices = metadata.get('legal_notices', [])
 
-    preexisting_registries = mongo_regeindary[meta].count_documents({"name": registry_name})
+    # One find (capped at 2 documents for the integrity check) answers both
+    # "does it exist?" and "what is its _id?" in a single round-trip;
+    # legalNotices is projected alongside _id for the change comparison below
+    preexisting = list(mongo_regeindary[meta].find(
+        {"name": registry_name}, projection={"_id": 1, "legalNotices": 1}).limit(2))
 
-    if preexisting_registries == 0:
+    if len(preexisting) == 0:
         logger.info(f"Registry '{registry_name}' not found - creating new entry with legal notices")
         result = mongo_regeindary[meta].insert_one({
             "name": registry_name,
@@ -745,9 +1214,9 @@ def create_registry(
         })
         logger.info(f"Created new registry metadata with ID: {result.inserted_id}")
         return result.inserted_id, None
-    elif preexisting_registries == 1:
+    elif len(preexisting) == 1:
         logger.info(f"Registry '{registry_name}' found - updating legal notices if changed")
-        existing = mongo_regeindary[meta].find_one({"name": registry_name})
+        existing = preexisting[0]
 
         # Update legal notices if they've changed
         if existing.get('legalNotices') != legal_notices:
@@ -759,12 +1228,9 @@ def create_registry(
 
         decision = delete_old_records(existing['_id'], collection)
         return existing['_id'], decision
-    elif preexisting_registries >= 2:
-        logger.error(f"Database integrity error: Found {preexisting_registries} registries with name '{registry_name}'")
-        raise Exception(f"Database integrity error: Found {preexisting_registries} registries with name '{registry_name}'. Expected 0 or 1.")
     else:
-        logger.error(f"Unexpected database state: Registry count for '{registry_name}' is {preexisting_registries}")
-        raise Exception(f"Unexpected database state: Registry count for '{registry_name}' is {preexisting_registries}. This should not be possible.")
+        logger.error(f"Database integrity error: Found multiple registries with name '{registry_name}'")
+        raise Exception(f"Database integrity error: Found multiple registries with name '{registry_name}'. Expected 0 or 1.")
 
 
 def get_registry_legal_notices(registry_id):
@@ -779,7 +1245,8 @@ def get_registry_legal_notices(registry_id):
     Returns:
         list: Array of legal notice objects, or empty list if none.
     """
-    registry = mongo_regeindary[meta].find_one({"_id": registry_id})
+    registry = mongo_regeindary[meta].find_one(
+        {"_id": registry_id}, projection={"legalNotices": 1})
     return registry.get('legalNotices', []) if registry else []
 
 
@@ -801,15 +1268,23 @@ def display_legal_notices(legal_notices):
         print(f"{'-'*70}\n")
 
 
-def list_registries():
+def list_registries(projection=None):
     """Retrieve all registries from the metadata collection.
 
+    Returns the cursor directly rather than materializing a list, so consumers
+    stream documents as the driver fetches them. Iterate it once (or wrap in
+    list() if random access is needed).
+
+    Args:
+        projection (dict, optional): Field projection passed to find(), e.g.
+            {"name": 1} - registry documents carry full legal-notice text, so
+            callers that don't need it can skip shipping it. Defaults to None
+            (full documents).
+
     Returns:
-        list: List of registry metadata documents.
+        Cursor: Cursor over registry metadata documents.
     """
-    mongo_registries = mongo_regeindary[meta].find({})
-    mongo_registries = [mongo_registry for mongo_registry in mongo_registries]
-    return mongo_registries
+    return mongo_regeindary[meta].find({}, projection).batch_size(100)
 
 
 def status_check():
@@ -823,32 +1298,64 @@ def status_check():
     global mongo_regeindary, collections_map
 
     logger.info("Starting database status check")
-    print("  Counting # Registries...", end="")
-    n_registries = mongo_regeindary[meta].count_documents({}, hint="_id_")
-    print(" ✔\n  Counting # Organizations...", end="")
-    n_organizations = mongo_regeindary[orgs].count_documents({}, hint="_id_")
-    print(" ✔\n  Counting # Filings...", end="")
-    n_filings = mongo_regeindary[filings].count_documents({},  hint="_id_")
+
+    # Optimized: Use aggregation pipeline to get counts for all registries in 2 queries instead of 2*N queries.
+    def count_by_registry(collection_name):
+        # The leading $sort on registryID lets the planner feed the $group
+        # from a registryID-prefixed index scan (the keys alone answer the
+        # count) instead of a collection scan that fetches every document
+        cursor = _diagnostic_collection(collection_name).aggregate([
+            {"$sort": {"registryID": 1}},
+            {"$group": {"_id": "$registryID", "count": {"$sum": 1}}}
+        ])
+        return {doc['_id']: doc['count'] for doc in cursor}
+
+    # Every statistic here is an independent server command, and pymongo
+    # releases the GIL during the round-trips, so issue them all at once:
+    # wall time is the slowest command instead of the sum. ($facet can't
+    # span collections, so the per-collection aggregates stay separate.)
+    # estimated_document_count() reads collection metadata in O(1) instead
+    # of scanning the _id index - exactness isn't needed for a status display.
+    print("  Gathering database statistics...", end="")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=6) as stat_executor:
+        n_registries_future = stat_executor.submit(_diagnostic_collection(meta).estimated_document_count)
+        n_organizations_future = stat_executor.submit(_diagnostic_collection(orgs).estimated_document_count)
+        n_filings_future = stat_executor.submit(_diagnostic_collection(filings).estimated_document_count)
+        org_counts_future = stat_executor.submit(count_by_registry, orgs)
+        filing_counts_future = stat_executor.submit(count_by_registry, filings)
+        dbstats_future = stat_executor.submit(mongo_regeindary.command, "dbstats")
+
+        n_registries = n_registries_future.result()
+        n_organizations = n_organizations_future.result()
+        n_filings = n_filings_future.result()
+        org_counts = org_counts_future.result()
+        filing_counts = filing_counts_future.result()
+        dbstats = dbstats_future.result()
     print(" ✔")
 
-    registries = list_registries()
+    registries = list_registries(projection={"name": 1, "download_completion": 1})
 
     logger.info(f"Database contains: {n_registries} registries, {n_organizations:,} organizations, {n_filings:,} filings")
     print(f"{n_registries} registries, {n_organizations:,} organizations, and {n_filings:,} filings")
-    # Optimized: Use aggregation pipeline to get counts for all registries in 2 queries instead of 2*N queries
-    print("  Aggregating counts by registry...", end="")
-    org_counts_cursor = mongo_regeindary[orgs].aggregate([
-        {"$group": {"_id": "$registryID", "count": {"$sum": 1}}}
-    ])
-    org_counts = {doc['_id']: doc['count'] for doc in org_counts_cursor}
-
-    filing_counts_cursor = mongo_regeindary[filings].aggregate([
-        {"$group": {"_id": "$registryID", "count": {"$sum": 1}}}
-    ])
-    filing_counts = {doc['_id']: doc['count'] for doc in filing_counts_cursor}
-    print(" ✔")
 
-    print(n_registries, "registries,", n_organizations, "organizations, and", n_filings, "filings")
+    # Opportunistically cache the per-registry counts on the registry
+    # documents (additive fields) so other consumers can read a recent count
+    # without re-running the aggregation; countCacheAt dates the snapshot
+    count_cache_ops = [
+        pymongo.UpdateOne(
+            {"_id": registry_oid},
+            {"$set": {
+                "orgCount": org_counts.get(registry_oid, 0),
+                "filingCount": filing_counts.get(registry_oid, 0),
+                "countCacheAt": datetime.now()
+            }}
+        )
+        for registry_oid in (org_counts.keys() | filing_counts.keys())
+        if registry_oid is not None
+    ]
+    if count_cache_ops:
+        mongo_regeindary[meta].bulk_write(count_cache_ops, ordered=False)
+
     for registry in registries:
         print(registry['name'].ljust(80, "."), end="")
 
@@ -859,14 +1366,6 @@ def status_check():
             completion_time = "NOT COMPLETED YET"
         print(completion_time, end="...................")
 
-        n_orgs_in_registry = mongo_regeindary[orgs].count_documents({'registryID': registry['_id']})
-        if n_organizations > 0:
-            fraction = n_orgs_in_registry / n_organizations
-            percentage = round(fraction * 100, 2)
-            percentage = f"{percentage}%"
-        else:
-            percentage = "N/A"
-            
         # Use pre-computed counts from aggregation instead of individual queries
         n_orgs_in_registry = org_counts.get(registry['_id'], 0)
         fraction = n_orgs_in_registry / n_organizations if n_organizations > 0 else 0
@@ -876,12 +1375,29 @@ def status_check():
         n_filings_in_registry = filing_counts.get(registry['_id'], 0)
         print(f" & {n_filings_in_registry} filings".ljust(30))
 
-    total_size = mongo_regeindary.command("dbstats")['totalSize']
+    total_size = dbstats['totalSize']
     size_gb = round((total_size / 1024 ** 3), 2)
     logger.info(f"Total database size: {size_gb} GB ({int(total_size):,} bytes)")
     print(f"{int(total_size):,} bytes = {size_gb} gigabytes")
 
 
+@functools.lru_cache(maxsize=16)
+def _load_json_file(path):
+    """Parse a JSON file and cache the result per path.
+
+    Used for the mapping and schema reads in keyword_match_assist, which are
+    pure functions of the file path within a session.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        Parsed JSON content (dict or list).
+    """
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
 def keyword_match_assist(select=None):
     """Interactive tool to check field mapping coverage against schema for a selected registry.
 
@@ -901,7 +1417,7 @@ def keyword_match_assist(select=None):
         "United States - Internal Revenue Service - Exempt Organizations Business Master File Extract": "UnitedStates"
     }
 
-    mongo_registries = mongo_regeindary[meta].find({})
+    mongo_registries = mongo_regeindary[meta].find({}, {"name": 1})
     options = {}
     for i, mongo_registry in enumerate(mongo_registries, start=1):
         options.update({
@@ -926,33 +1442,35 @@ def keyword_match_assist(select=None):
     # MAIN FUNCTION
     directory = directory_map[options[select]["name"]]
 
-    with open(f"{directory}/mapping.json", "r") as m:
-        mapping = json.load(m)
-    with open("../schemas/entity.json", "r") as s:
-        schema = json.load(s)
+    mapping = _load_json_file(f"{directory}/mapping.json")
+    schema = _load_json_file("../schemas/entity.json")
+
+    # One pass over the mapping builds every lookup structure the function
+    # needs; set literals avoid the list intermediates the old set([...])
+    # calls allocated twice over
+    targets = {x['target'] for x in mapping}
+    origin_to_target = {x['origin']: x['target'] for x in mapping}
+    schema_props = set(schema['properties'])
 
-    overlap = set.intersection(set([x['target'] for x in mapping]), set(schema['properties'].keys()))
+    overlap = targets & schema_props
     logger.info(f"Mapped schema fields ({len(overlap)}): {', '.join(sorted(overlap))}")
     print("✅ Schema fields already accounted for:", ", ".join(sorted(overlap)))
-    missing = set.difference(set(schema['properties'].keys()), set([x['target'] for x in mapping]))
+    missing = schema_props - targets
     logger.info(f"Unmapped schema fields ({len(missing)}): {', '.join(sorted(missing))}")
     print("⬜ Schema fields not accounted for:", ", ".join(sorted(missing)))
 
     random_entity = get_random_entity(mongo_filter={"registryID": options[select]['id']})
 
-    origin_to_target = {x['origin']: x['target'] for x in mapping}
-
-    longest_key_length = max(len(x) for x in random_entity['Original Data'].keys())
-    for x, y in random_entity['Original Data'].items():
-
-        print(x.ljust(longest_key_length + 2), end="")
-
-        if origin_to_target.get(x) in overlap:
-            print("✅".ljust(10), end="")
-        else:
-            print("⬜".ljust(10), end="")
-
-        print(y)
+    longest_key_length = max(map(len, random_entity['Original Data']), default=0)
+    # Build the whole field table first and emit it with one write - three
+    # print calls per field each flush through stdio separately
+    lines = [
+        f"{x.ljust(longest_key_length + 2)}"
+        f"{('✅' if origin_to_target.get(x) in overlap else '⬜').ljust(10)}"
+        f"{y}"
+        for x, y in random_entity['Original Data'].items()
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _has_unsupported_partial_filter(partial_filter):
@@ -984,17 +1502,28 @@ def _has_unsupported_partial_filter(partial_filter):
     return False
 
 
-def ensure_indexes(collections=None, verbose=True):
+# Collections whose INDEX_CONFIG has already been applied in this process.
+# ensure_indexes is called from every ingest/preview entry point, so after
+# the first call per collection the create_index round-trips are pure overhead.
+_indexes_ensured = set()
+
+
+def ensure_indexes(collections=None, verbose=True, force=False):
     """Ensure all required indexes exist for optimal query performance.
 
     Uses the INDEX_CONFIG to create indexes if they don't already exist.
     MongoDB's create_index() is idempotent - it won't recreate existing indexes.
+    Collections already ensured in this process are skipped entirely unless
+    force is set, so repeated ingest calls pay the round-trips only once.
 
     Args:
         collections (list, optional): List of collection names to index.
             If None, indexes all collections in INDEX_CONFIG.
             Valid values: 'organizations', 'filings', 'registries'.
         verbose (bool): If True, prints progress messages. Defaults to True.
+        force (bool): If True, bypass the per-process cache and re-issue the
+            create_index calls (e.g. after dropping indexes by hand).
+            Defaults to False.
 
     Returns:
         dict: Dictionary mapping collection names to lists of created/verified index names.
@@ -1003,6 +1532,8 @@ def ensure_indexes(collections=None, verbose=True):
 
     if collections is None:
         collections = list(INDEX_CONFIG.keys())
+    if not force:
+        collections = [c for c in collections if c not in _indexes_ensured]
 
     results = {}
 
@@ -1017,6 +1548,18 @@ def ensure_indexes(collections=None, verbose=True):
         if verbose:
             logger.info(f"Ensuring indexes for '{collection_name}' collection")
 
+        # One listIndexes round-trip tells us what already exists; only the
+        # genuinely missing indexes pay a create_index call below (normally
+        # none after the first-ever run against a database)
+        try:
+            existing_keys = {
+                tuple((field, int(direction) if isinstance(direction, (int, float)) else direction)
+                      for field, direction in index['key'].items())
+                for index in collection.list_indexes()
+            }
+        except pymongo.errors.OperationFailure:
+            existing_keys = set()  # Collection doesn't exist yet
+
         for index_spec in INDEX_CONFIG[collection_name]:
             # 🡨 Support both old (fields, unique) and new (fields, unique, partial) formats
             if len(index_spec) == 2:
@@ -1027,6 +1570,10 @@ def ensure_indexes(collections=None, verbose=True):
 
             index_keys = [(field, pymongo.ASCENDING) for field in fields]
 
+            if tuple(index_keys) in existing_keys:
+                results[collection_name].append('_'.join(f"{field}_1" for field in fields))
+                continue
+
             # 🡨 Build kwargs for create_index
             kwargs = {}
             if fields != ['_id']:   # Don't specify 'unique' for _id indexes (it's always unique)
@@ -1064,6 +1611,8 @@ def ensure_indexes(collections=None, verbose=True):
                     f"duplicate values exist in the collection."
                 ) from e
 
+        _indexes_ensured.add(collection_name)
+
     if verbose:
         total_indexes = sum(len(v) for v in results.values())
         logger.info(f"Ensured {total_indexes} indexes across {len(results)} collections")
@@ -1127,26 +1676,33 @@ def show_index_info(collection_name=None):
     print("Expected indexes from INDEX_CONFIG:")
     for coll_name, index_specs in INDEX_CONFIG.items():
         print(f"\n  {coll_name}:")
-        for fields, unique in index_specs:
-            unique_label = " [unique]" if unique else ""
-            print(f"    • ({', '.join(fields)}){unique_label}")
+        for fields, unique, partial_filter in index_specs:
+            labels = []
+            if unique:
+                labels.append("unique")
+            if partial_filter:
+                labels.append("partial")
+            label_str = f" [{', '.join(labels)}]" if labels else ""
+            print(f"    • ({', '.join(fields)}){label_str}")
 
     print("\n" + "=" * 70)
 
 
-def create_organization_from_orphan_filing(filing):
-    """Create an organization record from a filing that has no matching organization.
+# Function breadcrumb for orphan-created organizations, computed once at module
+# load - inspect.getfile()/currentframe() walk the frame stack on every call,
+# which is needless work in a per-orphan-filing hot path
+_ORPHAN_BREADCRUMB = f"{__file__} create_organization_from_orphan_filing()"
 
-    Clones relevant fields from the filing to create a minimal organization record.
-    Includes breadcrumb metadata for tracing the auto-generated organization back to its source.
+
+def _org_doc_from_orphan_filing(filing):
+    """Build (but do not insert) an organization document cloned from an orphan filing.
 
     Args:
         filing (dict): Filing document that has no matching organization.
 
     Returns:
-        ObjectId: MongoDB ObjectId of the newly created organization.
+        dict: Minimal organization document with breadcrumb metadata.
     """
-
     fields_to_clone = [
         'registryName',
         'registryId',
@@ -1158,22 +1714,34 @@ def create_organization_from_orphan_filing(filing):
 
     org_dict = {k: v for k, v in filing.items() if k in fields_to_clone}
 
-    # Generate Function Breadcrumb
-    file_name = inspect.getfile(inspect.currentframe())
-    function_name = inspect.currentframe().f_code.co_name
-    breadcrumb = f"{file_name} {function_name}()"
-
     original_data = {
-        "Generating Function": breadcrumb,
+        "Generating Function": _ORPHAN_BREADCRUMB,
         "Source Filing": filing['_id']
     }
 
     org_dict.update({"Original Data": original_data})
-    result = mongo_regeindary['organizations'].insert_one(org_dict)
+    return org_dict
+
+
+def create_organization_from_orphan_filing(filing):
+    """Create an organization record from a filing that has no matching organization.
+
+    Clones relevant fields from the filing to create a minimal organization record.
+    Includes breadcrumb metadata for tracing the auto-generated organization back to its source.
+    Batch callers should build documents with _org_doc_from_orphan_filing() and
+    insert them together via insert_many instead.
+
+    Args:
+        filing (dict): Filing document that has no matching organization.
+
+    Returns:
+        ObjectId: MongoDB ObjectId of the newly created organization.
+    """
+    result = mongo_regeindary['organizations'].insert_one(_org_doc_from_orphan_filing(filing))
     return result.inserted_id
 
 
-def match_filing(filing, matching_field=None, create_from_orphan="skip"):
+def match_filing(filing, matching_field=None, create_from_orphan="skip", execute=True):
     """
     Link a filing to its corresponding organization by updating the filing's entityId_mongo field.
 
@@ -1184,17 +1752,21 @@ def match_filing(filing, matching_field=None, create_from_orphan="skip"):
         create_from_orphan (str): If 'auto', automatically create organization from orphan filing.
                                         If 'prompt', prompt user for decision.
                                         If 'skip', skip.
+        execute (bool): If True, write the filing/organization updates immediately.
+                        If False, return the pymongo.UpdateOne operations instead so the
+                        caller can batch them through bulk_write (one round-trip per
+                        ~1000 filings rather than two per filing).
 
     Returns:
-        UpdateResult: MongoDB update result object.
+        UpdateResult: MongoDB update result object when execute=True.
+        tuple: (filing_op, org_op) pair of pymongo.UpdateOne operations when execute=False.
+        None: If the filing could not be matched and orphan creation was declined/skipped.
 
     Raises:
         Exception: If multiple organizations match (database integrity error) or if user declines
                   to create organization from orphan filing.
     """
     # TODO: determine if this cache technique is consistently faster ( 🡪 keep), sometimes faster ( 🡪 parameter), or never/trivial ( 🡪 remove)
-    global cache
-
     # TODO: make matching_field on entityIndex more dynamic
     if matching_field is not None:
         pass
@@ -1208,80 +1780,357 @@ def match_filing(filing, matching_field=None, create_from_orphan="skip"):
 
     # org_identifier = {"registryID": registry_id, matching_field: entity_id}
     # the below line of code fixes an import error with USA Data, the above line of code is ideal if import error fixed
-    if filing['registryName'] == "United States - Internal Revenue Service - Exempt Organizations Business Master File Extract":
-       org_identifier = {"registryID": registry_id, matching_field: str(entity_id).rjust(9, '0')}
-    elif filing['registryName'] == "England and Wales - Charity Commission Register of Charities":
-        org_identifier = {"registryID": registry_id, matching_field: entity_id, "$or": [{"subsidiaryIndex": {"$exists": False }}, {"subsidiaryIndex": 0}]}
+    if filing['registryName'] in _EIN_PADDED_REGISTRIES:
+       padded_id = entity_id if isinstance(entity_id, str) and len(entity_id) == 9 else str(entity_id).zfill(9)
+       org_identifier = {"registryID": registry_id, matching_field: padded_id}
+    elif filing['registryName'] == _ENGLAND_WALES_REGISTRY:
+        org_identifier = {"registryID": registry_id, matching_field: entity_id, **_ENGLAND_WALES_SUBSIDIARY_FILTER}
         # TODO: unclear if subsidiaryIndex should be 0 or 1 or something else
     else:
         org_identifier = {"registryID": registry_id, matching_field: entity_id}
 
-    #logger.info(f"{org_identifier} 🡪 ??? 🡪 ???")
-    #logger.info(f"{org_identifier} 🡪 {str(org_identifier.items())} 🡪 ???")
-    cache_result = cache.get(str(org_identifier.items()), None)
-    #logger.info(f"{org_identifier} 🡪 {str(org_identifier.items())} 🡪 {cache_result}")
+    # Plain tuple key instead of str(org_identifier.items()): no per-call
+    # string formatting, and hashing doesn't depend on dict insertion order.
+    # The constant E&W $or clause needs no representation in the key since
+    # registryID already disambiguates the registry.
+    cache_key = (registry_id, matching_field, org_identifier[matching_field])
+    cache_result = cache.get(cache_key, None)
     if cache_result:
-        logger.info(f"Cache hit for {entity_id} in {registry_id}: {cache_result}")
+        cache.move_to_end(cache_key)
+        logger.info("Cache hit for %s in %s: %s", entity_id, registry_id, cache_result)
         entity_id_mongo = cache_result
     elif not cache_result:
         entity_id_mongo = None
-        logger.info(f"Cache miss for {entity_id} in {registry_id}")
-        matched_orgs = mongo_regeindary[orgs].find(org_identifier)
-        matched_orgs = [matched_org for matched_org in matched_orgs]
-
-        if len(matched_orgs) == 0:
+        logger.info("Cache miss for %s in %s", entity_id, registry_id)
+        # Two results are enough to tell "exactly one" from "ambiguous", so a
+        # limit=2 count (a COUNT_SCAN bounded at two index keys) dispatches
+        # the branches without allocating a cursor or a result list; the
+        # single find_one on the happy path is covered by the
+        # (registryID, <field>, _id) index
+        n_matches = mongo_regeindary[orgs].count_documents(org_identifier, limit=2)
+
+        if n_matches == 0:
             if create_from_orphan == "auto":
-                logger.warning(f"No matching organization found for filing with {matching_field}='{entity_id}' - creating orphan organization")
+                logger.warning("No matching organization found for filing with %s=%r - creating orphan organization", matching_field, entity_id)
                 entity_id_mongo = create_organization_from_orphan_filing(filing)
             elif create_from_orphan == "prompt":
-                logger.warning(f"No matching organization found for filing with {matching_field}='{entity_id}'")
+                logger.warning("No matching organization found for filing with %s=%r", matching_field, entity_id)
                 print("⚠️  No matching organization found for filing (see below).")
                 pp(filing)
                 manual_decision = input("Create Organization from Orphan Filing? (y/n) ")
                 if manual_decision == "y":
                     entity_id_mongo = create_organization_from_orphan_filing(filing)
                 else:
-                    logger.warning(f"No matching organization found for filing with {matching_field}='{entity_id}' in registry '{registry_id}'. User declined to create orphan organization.")
+                    logger.warning("No matching organization found for filing with %s=%r in registry %r. User declined to create orphan organization.", matching_field, entity_id, registry_id)
                     return None
             elif create_from_orphan == "skip":
-                logger.warning(f"No matching organization found for filing with {matching_field}='{entity_id}' in registry '{registry_id}'. User declined to create orphan organization.")
+                logger.warning("No matching organization found for filing with %s=%r in registry %r. User declined to create orphan organization.", matching_field, entity_id, registry_id)
                 return None
-        elif len(matched_orgs) >= 2:
-            logger.error(f"Database integrity error: Found {len(matched_orgs)} organizations matching {matching_field}='{entity_id}'")
-            raise Exception(f"Database integrity error: Found {len(matched_orgs)} organizations matching {matching_field}='{entity_id}' in registry '{registry_id}'. Expected 0 or 1. Filing ID: {filing.get('_id', 'unknown')}")
-        elif len(matched_orgs) == 1:
-            [matched_org] = matched_orgs
+        elif n_matches >= 2:
+            # The count is capped at 2, so report "multiple" rather than an exact count
+            logger.error("Database integrity error: Found multiple organizations matching %s=%r", matching_field, entity_id)
+            raise Exception(f"Database integrity error: Found multiple organizations matching {matching_field}='{entity_id}' in registry '{registry_id}'. Expected 0 or 1. Filing ID: {filing.get('_id', 'unknown')}")
+        else:
+            matched_org = mongo_regeindary[orgs].find_one(org_identifier, projection={"_id": 1})
             entity_id_mongo = matched_org['_id']
-            logger.info(f"Matched filing {filing['_id']} with existing organization {entity_id_mongo} using {matching_field}='{entity_id}'")
+            logger.info("Matched filing %s with existing organization %s using %s=%r", filing['_id'], entity_id_mongo, matching_field, entity_id)
 
         if entity_id_mongo:
-            if len(cache) >= 10000:
-                cache = dict()
-            cache.update({str(org_identifier.items()) : entity_id_mongo})
+            cache[cache_key] = entity_id_mongo
+            if len(cache) > _CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
 
-    # TODO: refactor these from update_one to update many in optimal size batches (estimated to be between 500-50000)
     # Add linked organization record id to filing record
-    filing_result = mongo_regeindary[filings].update_one(
+    filing_op = pymongo.UpdateOne(
         {"_id": filing['_id']},
         {"$set": {"entityId_mongo": entity_id_mongo}}
     )
 
     # Add linked filing record id to list of filings in organization record
-    org_result = mongo_regeindary[orgs].update_one(
+    org_op = pymongo.UpdateOne(
         {"_id": entity_id_mongo},
         {"$addToSet": {"filings": filing['_id']}}
     )
 
+    if not execute:
+        return filing_op, org_op
 
+    filing_result = mongo_regeindary[filings].update_one(
+        {"_id": filing['_id']},
+        {"$set": {"entityId_mongo": entity_id_mongo}}
+    )
+    mongo_regeindary[orgs].update_one(
+        {"_id": entity_id_mongo},
+        {"$addToSet": {"filings": filing['_id']}}
+    )
 
     return filing_result
 
 
+# Registries whose entity ids need zero-padding back to 9 digits before they
+# compare equal (US EINs imported as integers lose their leading zeroes)
+_EIN_PADDED_REGISTRIES = (
+    "United States - Internal Revenue Service - Exempt Organizations Business Master File Extract",
+)
+
+# BSON expression that zero-pads the $lookup variable $$eid to 9 characters,
+# mirroring the client-side zfill so the padding happens on the server
+_EIN_PAD_EXPRESSION = {
+    "$concat": [
+        {"$substrCP": [
+            "000000000", 0,
+            {"$max": [0, {"$subtract": [9, {"$strLenCP": {"$toString": "$$eid"}}]}]}
+        ]},
+        {"$toString": "$$eid"}
+    ]
+}
+
+_ENGLAND_WALES_REGISTRY = "England and Wales - Charity Commission Register of Charities"
+
+_ENGLAND_WALES_SUBSIDIARY_FILTER = {
+    "$or": [
+        {"subsidiaryIndex": {"$exists": False}},
+        {"subsidiaryIndex": 0}
+    ]
+}
+
+
+def match_filings_batch(filings_list, matching_field=None, create_from_orphan="skip"):
+    """Resolve organization links for a batch of filings with one lookup query per registry.
+
+    Instead of one indexed find() per filing (as match_filing does), this
+    groups the batch by registry, issues a single $in query per group, and
+    builds an in-memory {entity id -> org _id} dict to resolve every filing in
+    the group. Cursor setup and index descent are amortized across the whole
+    batch. Registry quirks match match_filing: US EINs are zero-padded to 9
+    digits and England & Wales lookups exclude subsidiary records.
+
+    Args:
+        filings_list (list): Unmatched filing documents to resolve.
+        matching_field (str): Field name to use for matching. Defaults to 'entityId'.
+        create_from_orphan (str): If 'auto', create organizations for filings with no
+                                  match. If 'skip' (default), leave them unmatched.
+
+    Returns:
+        tuple: (filing_ops, org_ops, skipped) where the first two are lists of
+        pymongo.UpdateOne operations ready for bulk_write and skipped is the
+        number of filings left unmatched.
+
+    Raises:
+        Exception: If one entity id maps to multiple organizations (database integrity error).
+    """
+    if matching_field is None:
+        matching_field = 'entityId'
+
+    filing_ops = []
+    org_ops = []
+    skipped = 0
+
+    by_registry = {}
+    for filing in filings_list:
+        by_registry.setdefault(filing['registryID'], []).append(filing)
+
+    for registry_id, registry_filings in by_registry.items():
+        registry_name = registry_filings[0].get('registryName', '')
+        needs_padding = registry_name in _EIN_PADDED_REGISTRIES
+
+        if needs_padding:
+            if len(registry_filings) >= 5000:
+                # Large direct-called batches: pad the whole column in one
+                # Cython pass. Imported lazily so interface start-up (and the
+                # common 500-filing sweep batches, where Series construction
+                # would cost more than it saves) never pays for pandas here.
+                import pandas as pd
+                match_values = (
+                    pd.Series([f[matching_field] for f in registry_filings])
+                    .astype("string").str.zfill(9).tolist()
+                )
+            else:
+                # Most EINs arrive already 9-char strings; skip the str()+pad
+                # allocations for those and use zfill (C fast path) for the rest
+                match_values = [
+                    v if isinstance(v := f[matching_field], str) and len(v) == 9 else str(v).zfill(9)
+                    for f in registry_filings
+                ]
+        else:
+            match_values = [f[matching_field] for f in registry_filings]
+
+        # Source data is inconsistent about string vs numeric ids, so query
+        # both representations (same approach as preview_new_records)
+        query_values = list({*match_values, *(str(v) for v in match_values)})
+        query = {"registryID": registry_id, matching_field: {"$in": query_values}}
+        if registry_name == _ENGLAND_WALES_REGISTRY:
+            query.update(_ENGLAND_WALES_SUBSIDIARY_FILTER)
+
+        lookup = {}
+        for org in mongo_regeindary[orgs].find(query, {"_id": 1, matching_field: 1}):
+            key = str(org[matching_field])
+            if key in lookup and lookup[key] != org['_id']:
+                logger.error("Database integrity error: multiple organizations match %s=%r", matching_field, key)
+                raise Exception(f"Database integrity error: Found multiple organizations matching "
+                                f"{matching_field}='{key}' in registry '{registry_id}'. Expected 0 or 1.")
+            lookup[key] = org['_id']
+
+        # Structure-of-arrays pass: resolve every id against the lookup dict
+        # first, handle the (rare) orphans, then build both op lists from
+        # parallel arrays - no per-filing dict construction in the hot path
+        filing_ids = [f['_id'] for f in registry_filings]
+        resolved = [lookup.get(str(v)) for v in match_values]
+
+        orphan_positions = [i for i, oid in enumerate(resolved) if oid is None]
+        if orphan_positions and create_from_orphan == "auto":
+            logger.warning("No matching organization found for %d filings - creating orphan organizations", len(orphan_positions))
+            # Callers may pass projection-trimmed filings; the orphan clones
+            # need the full documents, so refetch them in one query, then
+            # insert every new organization in a single insert_many rather
+            # than stalling the batch with one insert per orphan
+            orphan_ids = [filing_ids[i] for i in orphan_positions]
+            full_filings = {doc['_id']: doc for doc in mongo_regeindary[filings].find({"_id": {"$in": orphan_ids}})}
+            org_docs = [_org_doc_from_orphan_filing(full_filings[fid]) for fid in orphan_ids]
+            insert_result = mongo_regeindary[orgs].insert_many(org_docs, ordered=False)
+            for position, inserted_id in zip(orphan_positions, insert_result.inserted_ids):
+                resolved[position] = inserted_id
+        else:
+            skipped += len(orphan_positions)
+
+        filing_ops.extend(
+            pymongo.UpdateOne({"_id": fid}, {"$set": {"entityId_mongo": oid}})
+            for fid, oid in zip(filing_ids, resolved) if oid is not None
+        )
+        org_ops.extend(
+            pymongo.UpdateOne({"_id": oid}, {"$addToSet": {"filings": fid}})
+            for fid, oid in zip(filing_ids, resolved) if oid is not None
+        )
+
+    return filing_ops, org_ops, skipped
+
+
+def _server_side_match_pass(limit=None):
+    """Bulk-match unmatched filings with a single $lookup + $merge aggregation per registry.
+
+    Builds a server-side join from filings to organizations keyed on
+    (registryID, entityId) and writes entityId_mongo back via $merge, so the
+    common case is one pipelined pass on the server instead of one find/update
+    round-trip per filing. For registries in _EIN_PADDED_REGISTRIES the
+    filing-side id is zero-padded in BSON (see _EIN_PAD_EXPRESSION) so even
+    the US join runs entirely server-side. Filings with zero or multiple
+    candidate organizations fall through the $size filter untouched and are
+    swept up afterwards by the per-filing loop in run_all_match_filings().
+
+    After each registry's merge, a second aggregation back-fills the reverse
+    organization.filings link ($setUnion keeps it idempotent, matching the
+    per-filing path's $addToSet), so both matching paths maintain the same
+    entity -> filings traversal.
+
+    Args:
+        limit (int, optional): Cap on filings to process across all
+            registries. Defaults to None (no cap).
+
+    Returns:
+        int: Number of filings matched across all registries.
+    """
+    unmatched_identifier = {"entityId_mongo": {"$exists": False}}
+
+    registry_names = [
+        doc['_id'] for doc in mongo_regeindary[filings].aggregate([
+            {"$match": unmatched_identifier},
+            {"$group": {"_id": "$registryName"}}
+        ])
+    ]
+
+    total_matched = 0
+    remaining = limit
+    for registry_name in registry_names:
+        # The cap is a running budget across registries - without it a batch
+        # request of N could match up to N filings per registry
+        if remaining is not None and remaining <= 0:
+            break
+        registry_filter = {**unmatched_identifier, "registryName": registry_name}
+
+        # Zero-pad the filing-side id in BSON for registries that need it, so
+        # the padding (like the rest of the join) never touches Python
+        filing_id_expr = _EIN_PAD_EXPRESSION if registry_name in _EIN_PADDED_REGISTRIES else "$$eid"
+
+        lookup_pipeline = [
+            {"$match": {"$expr": {"$and": [
+                {"$eq": ["$registryID", "$$rid"]},
+                {"$eq": ["$entityId", filing_id_expr]}
+            ]}}}
+        ]
+        if registry_name == _ENGLAND_WALES_REGISTRY:
+            lookup_pipeline.append({"$match": _ENGLAND_WALES_SUBSIDIARY_FILTER})
+        # Two candidates are enough to distinguish "exactly one" from "ambiguous"
+        lookup_pipeline.extend([{"$project": {"_id": 1}}, {"$limit": 2}])
+
+        pipeline = [{"$match": registry_filter}]
+        if remaining is not None:
+            pipeline.append({"$limit": remaining})
+        pipeline.extend([
+            {"$lookup": {
+                "from": orgs,
+                "let": {"rid": "$registryID", "eid": "$entityId"},
+                "pipeline": lookup_pipeline,
+                "as": "_org"
+            }},
+            {"$match": {"_org": {"$size": 1}}},
+            {"$set": {"entityId_mongo": {"$arrayElemAt": ["$_org._id", 0]}}},
+            {"$unset": "_org"},
+            {"$merge": {
+                "into": filings,
+                "on": "_id",
+                "whenMatched": "merge",
+                "whenNotMatched": "discard"
+            }}
+        ])
+
+        # $merge returns nothing, so bracket the run with counts to report progress
+        before_count = mongo_regeindary[filings].count_documents(registry_filter)
+        logger.info("Server-side match pass for %s: %s unmatched filings", registry_name, f"{before_count:,}")
+        print(f"  Bulk-matching {registry_name}...", end="")
+
+        list(mongo_regeindary[filings].aggregate(pipeline, allowDiskUse=True))
+
+        after_count = mongo_regeindary[filings].count_documents(registry_filter)
+        matched = before_count - after_count
+        total_matched += matched
+        if remaining is not None:
+            remaining -= matched
+
+        # Back-fill the reverse organization.filings link for the registry's
+        # matched filings, mirroring the per-filing path's $addToSet. The
+        # $setUnion makes the pass idempotent, so re-running over already
+        # linked filings is harmless.
+        if matched > 0:
+            mongo_regeindary[filings].aggregate([
+                {"$match": {"registryName": registry_name,
+                            "entityId_mongo": {"$type": "objectId"}}},
+                {"$group": {"_id": "$entityId_mongo",
+                            "filingIds": {"$addToSet": "$_id"}}},
+                {"$merge": {
+                    "into": orgs,
+                    "on": "_id",
+                    "whenMatched": [{"$set": {"filings": {"$setUnion": [
+                        {"$ifNull": ["$filings", []]}, "$$new.filingIds"
+                    ]}}}],
+                    "whenNotMatched": "discard"
+                }}
+            ], allowDiskUse=True)
+
+        logger.info("✔ Server-side match pass for %s matched %s filings", registry_name, f"{matched:,}")
+        print(f" ✔ {matched:,} matched")
+
+    return total_matched
+
+
 def run_all_match_filings(batch_size=False):
     """Match all unmatched filings to their corresponding organizations with progress tracking.
 
-    Creates the necessary indexes for performance, then iteratively processes unmatched filings.
-    Displays progress updates every 5 minutes. Supports graceful interruption via Ctrl+C.
+    Creates the necessary indexes for performance, then runs a server-side
+    $lookup/$merge pass to bulk-match the common case (see
+    _server_side_match_pass) before iteratively processing whatever remains:
+    orphan filings, ambiguous matches, and registries that need client-side ID
+    transformation. Displays progress updates every 5 minutes. Supports
+    graceful interruption via Ctrl+C.
 
     Args:
         batch_size (int or False): Number of filings to match. If False, matches all unmatched
@@ -1292,53 +2141,118 @@ def run_all_match_filings(batch_size=False):
     ensure_indexes(collections=['organizations', 'filings'], verbose=True)
 
     unmatched_identifier = {"entityId_mongo": {"$exists": False}}
-    matched_identifier = {"entityId_mongo": {"$exists": True}}
 
+    logger.info("Running server-side bulk match pass...")
+    print("Phase 1/2: Server-side bulk matching")
+    bulk_matched = _server_side_match_pass(limit=batch_size if batch_size else None)
+    logger.info(f"✔ Server-side pass matched {bulk_matched:,} filings")
+    print(f"✔ Bulk pass matched {bulk_matched:,} filings")
+
+    print("Phase 2/2: Per-filing sweep of the remainder")
     if batch_size:
         logger.info(f"Starting batch matching operation for {batch_size:,} filings")
-        n_unmatched = batch_size
+        # The bulk pass counts toward the requested batch
+        n_unmatched = max(batch_size - bulk_matched, 0)
     else:
-        logger.info("Counting total filings...")
-        n_total = mongo_regeindary[filings].count_documents(filter={}, hint="_id_")
-        logger.info(f"Total filings: {n_total:,}")
-
-        logger.info("Counting matched filings...")
-        n_matched = mongo_regeindary[filings].count_documents(matched_identifier)
-        logger.info(f"Already matched: {n_matched:,}")
-
-        n_unmatched = n_total - n_matched
+        # One bounded count of the unmatched subset rather than the previous
+        # two full scans (total minus matched)
+        logger.info("Counting unmatched filings...")
+        n_unmatched = mongo_regeindary[filings].count_documents(unmatched_identifier)
         logger.info(f"Unmatched filings to process: {n_unmatched:,}")
 
 
     reference_unmatched = n_unmatched
     reference_time = datetime.now()
 
-    skips = 0
+    skips = 0  # Running count of filings left unmatched (orphans etc.)
+    flush_threshold = 1000
+    pending_filing_ops = []
+    pending_org_ops = []
+
+    def flush_pending_ops():
+        """Send accumulated UpdateOne operations in two bulk_write calls and clear the buffers."""
+        if pending_filing_ops:
+            mongo_regeindary[filings].bulk_write(pending_filing_ops, ordered=False)
+            pending_filing_ops.clear()
+        if pending_org_ops:
+            mongo_regeindary[orgs].bulk_write(pending_org_ops, ordered=False)
+            pending_org_ops.clear()
+
+    fetch_size = 500
+    # The batch resolver spends its time waiting on MongoDB sockets (pymongo
+    # releases the GIL during I/O), so a few threads keep several lookup
+    # queries in flight against the server at once
+    match_workers = 4
 
     try:
-        while n_unmatched > 0:
-            print(f"\r  {n_unmatched:,} unmatched filings remaining".ljust(50), end="")
-            filing = mongo_regeindary[filings].find_one(unmatched_identifier, skip=skips, sort=[("_id", pymongo.ASCENDING)])
-
-            if not filing:
-                print("")
-                logger.info("No unmatched filings found.")
-                print(f"\r  No unmatched filings found.".ljust(50))
-                break
-
-            result = match_filing(filing)
-            if not result:
-                skips += 1
-            n_unmatched -= 1
-
-            time_difference = datetime.now() - reference_time
-            interval_minutes = 5
-            if time_difference.total_seconds() > (interval_minutes * 60):
-                unmatched_difference = reference_unmatched - n_unmatched
-                logger.info(f"Progress update: {unmatched_difference:,} filings matched in last {interval_minutes} minutes")
-                print(f"\n• {interval_minutes} minutes elapsed: {unmatched_difference:,} filings matched")
-                reference_time = datetime.now()
-                reference_unmatched = n_unmatched
+        # Paginate with an _id range instead of skip: skip re-walks discarded
+        # documents on every fetch (O(N²) across the run), while "_id > last"
+        # is a forward-only cursor that also skips buffered-but-unflushed and
+        # permanently-orphaned filings without any offset bookkeeping. It
+        # makes resuming after Ctrl+C trivial too.
+        last_id = None
+        last_print = 0.0
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=match_workers) as match_pool:
+            while n_unmatched > 0:
+                # Throttle the carriage-return progress line to once per
+                # second - each print is a write+flush syscall, which adds up
+                # at thousands of filings per second
+                now = time.monotonic()
+                if now - last_print > 1.0:
+                    print(f"\r  {n_unmatched:,} unmatched filings remaining".ljust(50), end="")
+                    last_print = now
+                batches = []
+                fetched = 0
+                for i in range(match_workers):
+                    page_filter = dict(unmatched_identifier)
+                    if last_id is not None:
+                        page_filter["_id"] = {"$gt": last_id}
+                    # Matching only needs the identifiers - leave the rest of
+                    # the document (including "Original Data" blobs) on the
+                    # server rather than decoding it per filing
+                    page = list(
+                        mongo_regeindary[filings].find(
+                            page_filter,
+                            projection={"_id": 1, "registryID": 1, "registryName": 1,
+                                        "entityId": 1, "entityIndex": 1}
+                        )
+                        .sort("_id", pymongo.ASCENDING)
+                        .limit(min(fetch_size, n_unmatched - fetched))
+                    )
+                    if not page:
+                        break
+                    batches.append(page)
+                    fetched += len(page)
+                    last_id = page[-1]['_id']
+                    if fetched >= n_unmatched:
+                        break
+
+                if not batches:
+                    print("")
+                    logger.info("No unmatched filings found.")
+                    print(f"\r  No unmatched filings found.".ljust(50))
+                    break
+
+                futures = [match_pool.submit(match_filings_batch, batch) for batch in batches]
+                for future in concurrent.futures.as_completed(futures):
+                    batch_filing_ops, batch_org_ops, batch_skipped = future.result()
+                    pending_filing_ops.extend(batch_filing_ops)
+                    pending_org_ops.extend(batch_org_ops)
+                    skips += batch_skipped
+
+                if len(pending_filing_ops) >= flush_threshold:
+                    flush_pending_ops()
+                n_unmatched -= fetched
+
+                time_difference = datetime.now() - reference_time
+                interval_minutes = 5
+                if time_difference.total_seconds() > (interval_minutes * 60):
+                    unmatched_difference = reference_unmatched - n_unmatched
+                    logger.info("Progress update: %s filings matched in last %d minutes", f"{unmatched_difference:,}", interval_minutes)
+                    print(f"\n• {interval_minutes} minutes elapsed: {unmatched_difference:,} filings matched")
+                    reference_time = datetime.now()
+                    reference_unmatched = n_unmatched
 
         print(f"\r  All filings matched successfully!".ljust(50))
         logger.info("✔ Filing matching completed successfully")
@@ -1346,6 +2260,9 @@ def run_all_match_filings(batch_size=False):
     except KeyboardInterrupt:
         logger.warning("Matching process interrupted by user")
         print("\nMatching process stopped by user")
+    finally:
+        # Write out whatever is still buffered, including after Ctrl+C
+        flush_pending_ops()
 
 
 def completion_timestamp(meta_id, completion_type="download"):
@@ -1384,20 +2301,21 @@ def get_random_entity(display=False, mongo_filter=None, hard_limit=False):
         dict: Random organization document from the database.
     """
     logger.debug("Retrieving random organization entity from database")
-    if mongo_filter is None:
-        mongo_filter = {}
-        hint = "_id_"
-    else:
-        hint = None
-    limit = mongo_regeindary.organizations.count_documents(mongo_filter, hint=hint) + 1
+    # $sample uses the storage engine's native random-cursor path, unlike the
+    # previous count_documents + skip approach which scanned and discarded up
+    # to N documents per call
+    pipeline = []
+    if mongo_filter:
+        pipeline.append({"$match": mongo_filter})
     if hard_limit:
-        if limit > hard_limit:
-            limit = hard_limit
-    random_select = random.randrange(0, limit)
-    if display:
-        print("Entity", random_select, "of", limit)
-    random_entity = mongo_regeindary.organizations.find_one(mongo_filter, skip=random_select)
-    if display:
+        pipeline.append({"$limit": hard_limit})
+    pipeline.append({"$sample": {"size": 1}})
+    random_entity = next(_diagnostic_collection(orgs).aggregate(pipeline), None)
+    if display and not mongo_filter:
+        # estimated_document_count reads collection metadata in O(1) - no
+        # index scan - so the "out of N" context line stays essentially free
+        print(f"Sampled 1 entity of ~{_diagnostic_collection(orgs).estimated_document_count():,}")
+    if display and random_entity:
         if display == "No Original":
             del random_entity['Original Data']
         (pp(random_entity))
@@ -1408,43 +2326,78 @@ def get_all_urls(entity_id):
     # For future implementation -- this is the more "in-depth" path
     # Possible uses include: -- finding correct URLs if most recent is a dud/typo
     #                        -- using historical/redirect URLs in matching process
-    z = mongo_regeindary[filings].find({"entityId_mongo": bson.ObjectId(entity_id)})
-    u = set([x['websiteUrl'].lower() for x in z])
+    # distinct() deduplicates server-side and returns only the URL values,
+    # instead of shipping every full filing document over the wire
+    urls = mongo_regeindary[filings].distinct("websiteUrl", {"entityId_mongo": bson.ObjectId(entity_id)})
+    u = {url.lower() for url in urls if isinstance(url, str)}
     print(u)
     return u
 
 
 def get_most_recent_url(entity_id):
-    z = mongo_regeindary[filings].aggregate([
-        {"$match" : {"entityId_mongo": bson.ObjectId(entity_id)}},
-        {"$project" : {"websiteUrl" : 1, 'recordDate' : 1}},
-        {"$sort": {"recordDate": -1}},
-        {"$limit" : 1}
-    ])
-
-    url = None
-    for x in z:
-        url = x['websiteUrl']
-        if type(url) == float:
-            url = None
+    # A find_one with an indexed sort replaces the previous 4-stage aggregate:
+    # the (entityId_mongo, recordDate) compound index serves the equality
+    # match and the descending sort directly - no pipeline, no in-memory sort
+    doc = mongo_regeindary[filings].find_one(
+        {"entityId_mongo": bson.ObjectId(entity_id)},
+        projection={"websiteUrl": 1},
+        sort=[("recordDate", pymongo.DESCENDING)]
+    )
+
+    url = doc.get('websiteUrl') if doc else None
+    if type(url) == float:  # NaN from pandas imports means "no URL"
+        url = None
 
     return url
 
 
-def get_entities_that_need_websites(batch_size = False):
+def get_entities_that_need_websites(batch_size=False):
+    """Backfill organization websiteUrl values from each entity's most recent filing.
+
+    One server-side aggregation on filings ($match string URLs → $sort by
+    recordDate → $group taking the most recent per entity → $merge into
+    organizations) replaces the previous loop of three round-trips per
+    organization (find_one, get_most_recent_url aggregate, update_one). The
+    $merge pipeline only fills the gap - an existing websiteUrl is never
+    overwritten. On a full run, organizations left without a usable URL are
+    marked websiteUrl=None afterwards (as the old loop did) so they are not
+    re-examined next time.
+
+    Args:
+        batch_size (int or False): Cap on entities to backfill. If False (default),
+            process everything and also mark the no-URL remainder.
+    """
     print("Counting entities without websiteUrl listed...")
     missing_websites = mongo_regeindary[orgs].count_documents({"websiteUrl": {"$exists": False}})
     print(f"{missing_websites:,} entities have not been matched with a websiteUrl (or determined to have no match)")
+    if not missing_websites:
+        return
 
+    pipeline = [
+        {"$match": {"entityId_mongo": {"$ne": None}, "websiteUrl": {"$type": "string"}}},
+        {"$sort": {"entityId_mongo": 1, "recordDate": -1}},
+        {"$group": {"_id": "$entityId_mongo", "websiteUrl": {"$first": "$websiteUrl"}}},
+    ]
     if batch_size:
-        missing_websites = batch_size
-    while missing_websites > 0:
-        z = mongo_regeindary[orgs].find_one({"websiteUrl" : {"$exists" : False}})
-        missing_website_id = z['_id']
-        print(f"{missing_websites:,} remaining: mongoId of org without websiteUrl:", missing_website_id, end=" --> ")
-
-        url = get_most_recent_url(missing_website_id)
-        print("Matched URL: ", url)
-        r = mongo_regeindary[orgs].update_one({"_id" : missing_website_id}, {"$set" : {"websiteUrl" : url}})
-
-        missing_websites -= 1
+        pipeline.append({"$limit": batch_size})
+    pipeline.append({"$merge": {
+        "into": orgs,
+        "on": "_id",
+        # Fill the gap only - never clobber a websiteUrl the org already has
+        "whenMatched": [{"$set": {"websiteUrl": {"$ifNull": ["$websiteUrl", "$$new.websiteUrl"]}}}],
+        "whenNotMatched": "discard"
+    }})
+
+    print("Filling websiteUrl from most recent filings (server-side)...")
+    list(mongo_regeindary[filings].aggregate(pipeline, allowDiskUse=True))
+
+    still_missing = mongo_regeindary[orgs].count_documents({"websiteUrl": {"$exists": False}})
+    print(f"✔ {missing_websites - still_missing:,} entities matched with a websiteUrl")
+
+    if not batch_size and still_missing:
+        # Mirror the old loop's behavior of recording "no match available"
+        result = mongo_regeindary[orgs].update_many(
+            {"websiteUrl": {"$exists": False}},
+            {"$set": {"websiteUrl": None}}
+        )
+        print(f"✔ {result.modified_count:,} entities marked as having no websiteUrl available")